@@ -5,7 +5,7 @@ Extracts as much information as possible from a video file.
 """
 from . import monkeypatch as _monkeypatch
 
-from .api import guessit, GuessItApi
+from .api import guessit, guessit_many, GuessItApi
 from .options import ConfigurationException
 from .rules.common.quantity import Size
 
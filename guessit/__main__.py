@@ -9,29 +9,34 @@ import logging
 import sys
 
 from collections import OrderedDict
+from itertools import tee
 
 from rebulk.__version__ import __version__ as __rebulk_version__
 
 from guessit import api
 from guessit.__version__ import __version__
-from guessit.jsonutils import GuessitEncoder
-from guessit.options import argument_parser, parse_options, load_config, merge_options
+from guessit.cache import SqliteCache
+from guessit.jsonutils import GuessitEncoder, NdjsonWriter
+from guessit.options import get_argument_parser, parse_options, load_config, merge_options
 
 
-def guess_filename(filename, options):
+def guess_filename(filename, options, guess=None):
     """
     Guess a single filename using given options
     :param filename: filename to parse
     :type filename: str
     :param options:
     :type options: dict
+    :param guess: guess already computed for this filename, if any
+    :type guess: dict
     :return:
     :rtype:
     """
     if not options.get('yaml') and not options.get('json') and not options.get('show_property'):
         print('For:', filename)
 
-    guess = api.guessit(filename, options)
+    if guess is None:
+        guess = api.guessit(filename, options)
 
     if options.get('show_property'):
         print(guess.get(options.get('show_property'), ''))
@@ -59,6 +64,86 @@ def guess_filename(filename, options):
         print('GuessIt found:', json.dumps(guess, cls=GuessitEncoder, indent=4, ensure_ascii=False))
 
 
+def guess_filenames(filenames, options):
+    """
+    Guess filenames using given options, in worker processes when jobs option is greater than 1
+    :param filenames: filenames to parse
+    :type filenames: iterable
+    :param options:
+    :type options: dict
+    :return: count of guessed filenames
+    :rtype: int
+    """
+    count = 0
+    writer = NdjsonWriter(sys.stdout) if options.get('ndjson') else None
+    try:
+        for filename, guess in _iter_guesses(filenames, options):
+            if writer:
+                writer.write(filename, guess if guess is not None else api.guessit(filename, options))
+            else:
+                guess_filename(filename, options, guess)
+            count += 1
+    finally:
+        if writer:
+            writer.flush()
+    return count
+
+
+def _parallel_jobs(options):
+    jobs = options.get('jobs')
+    return jobs if jobs and jobs > 1 else None
+
+
+def _iter_guesses(filenames, options):
+    """
+    Iterate filenames with their guess, computed in worker processes when jobs option is greater than 1.
+
+    Guess is None when it should be computed by the caller.
+    """
+    jobs = _parallel_jobs(options)
+    if not jobs:
+        for filename in filenames:
+            yield filename, None
+        return
+
+    from guessit.parallel import GuessItExecutor  # pylint:disable=import-outside-toplevel
+
+    filenames, to_guess = tee(filenames)
+    with GuessItExecutor(options, max_workers=jobs, cache=options.get('cache')) as executor:
+        for filename, guess in zip(filenames, executor.map(to_guess)):
+            if isinstance(guess, Exception):
+                raise guess
+            yield filename, guess
+
+
+def _iter_lines(lines):
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def iter_filenames(options):
+    """
+    Iterate filenames given as arguments, and then lines of the input file.
+
+    Input file is read lazily, line by line. "-" input file reads lines from standard input.
+    :param options:
+    :type options: dict
+    :return:
+    :rtype: iterator[str]
+    """
+    if options.get('filename'):
+        yield from _iter_lines(options.get('filename'))
+
+    input_file = options.get('input_file')
+    if input_file == '-':
+        yield from _iter_lines(sys.stdin)
+    elif input_file:
+        with open(input_file, 'r', encoding='utf-8') as lines:
+            yield from _iter_lines(lines)
+
+
 def display_properties(options):
     """
     Display properties
@@ -107,6 +192,14 @@ def main(args=None):  # pylint:disable=too-many-branches
         logging.basicConfig(stream=sys.stdout, format='%(message)s')
         logging.getLogger().setLevel(logging.DEBUG)
 
+    if options.get('serve'):
+        if options.get('filename') or options.get('input_file'):
+            get_argument_parser().error('--serve guesses strings given by requests, not filenames or --input-file')
+        from guessit.server import serve, default_address  # pylint:disable=import-outside-toplevel
+        with api.GuessItApi(cache=options.get('cache')) as server_api:
+            serve(options.get('listen') or default_address, options, server_api)
+        return
+
     help_required = True
 
     if options.get('version'):
@@ -131,23 +224,20 @@ def main(args=None):  # pylint:disable=too-many-branches
         display_properties(options)
         help_required = False
 
-    filenames = []
-    if options.get('filename'):
-        for filename in options.get('filename'):
-            filenames.append(filename)
-    if options.get('input_file'):
-        with open(options.get('input_file'), 'r', encoding='utf-8') as input_file:
-            filenames.extend([line.strip() for line in input_file.readlines()])
-
-    filenames = list(filter(lambda f: f, filenames))
-
-    if filenames:
-        for filename in filenames:
+    cache = None
+    if options.get('cache') and not _parallel_jobs(options):
+        # Worker processes open the cache themselves.
+        cache = api.default_api.cache = SqliteCache(options.get('cache'))
+    try:
+        if guess_filenames(iter_filenames(options), options):
             help_required = False
-            guess_filename(filename, options)
+    finally:
+        if cache:
+            cache.close()
+            api.default_api.cache = None
 
     if help_required:  # pragma: no cover
-        argument_parser.print_help()
+        get_argument_parser().print_help()
 
 
 if __name__ == '__main__':  # pragma: no cover
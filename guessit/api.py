@@ -4,6 +4,8 @@
 API functions that can be used by external software
 """
 
+import hashlib
+import json
 import os
 import traceback
 from collections import OrderedDict
@@ -13,8 +15,10 @@ from pathlib import Path
 from rebulk.introspector import introspect
 
 from .__version__ import __version__
+from .cache import LRUCache, SqliteCache
 from .options import parse_options, load_config, merge_options
 from .rules import rebulk_builder
+from .rules.common.words import InputAnalysis
 
 
 class GuessitException(Exception):
@@ -38,6 +42,20 @@ class GuessitException(Exception):
         self.string = string
         self.options = options
 
+    def __reduce__(self):
+        return _restore_guessit_exception, (self.__class__, self.args, self.string, self.options)
+
+
+def _restore_guessit_exception(cls, args, string, options):
+    """
+    Restore a pickled GuessitException, keeping the report built when it was raised.
+    """
+    err = cls.__new__(cls)
+    err.args = args
+    err.string = string
+    err.options = options
+    return err
+
 
 def configure(options=None, rules_builder=None, force=False):
     """
@@ -74,6 +92,19 @@ def guessit(string, options=None):
     return default_api.guessit(string, options)
 
 
+def guessit_many(strings, options=None):
+    """
+    Retrieves all matches from each string of an iterable as a list of dict
+    :param strings: the filenames or release names, optionally given as (string, options) tuples
+    :type strings: iterable
+    :param options:
+    :type options: str|dict
+    :return:
+    :rtype: list
+    """
+    return default_api.guessit_many(strings, options)
+
+
 def properties(options=None):
     """
     Retrieves all properties with possible values that can be guessed
@@ -98,23 +129,123 @@ def suggested_expected(titles, options=None):
     return default_api.suggested_expected(titles, options)
 
 
-class GuessItApi:
+# Rulesets shared by all api instances of the process, keyed by rules builder, advanced config hash and enabled
+# properties.
+_rulesets = OrderedDict()
+_rulesets_maxsize = 16
+
+
+def _ruleset(rules_builder, advanced_config, advanced_config_hash, force=False, *, includes=None, excludes=None):
+    """
+    Get rebulk rules built with rules_builder from advanced_config.
+
+    Built rules are shared with all api instances of the process, and with child processes forked afterwards, so they
+    are built only once for each advanced config.
+    :param rules_builder:
+    :type rules_builder:
+    :param advanced_config:
+    :type advanced_config: dict
+    :param advanced_config_hash:
+    :type advanced_config_hash: str
+    :param force: build rules even if they are already built
+    :type force: bool
+    :param includes: properties to guess, given only to the default rules builder.
+    :type includes: frozenset
+    :param excludes: properties not to guess, given only to the default rules builder.
+    :type excludes: frozenset
+    :return:
+    :rtype: Rebulk
+    """
+    key = (rules_builder, advanced_config_hash, includes, excludes)
+    if force:
+        for stale in [k for k in _rulesets if k[:2] == key[:2]]:
+            del _rulesets[stale]
+    rebulk = _rulesets.get(key)
+    if rebulk is None:
+        if includes is None and excludes is None:
+            rebulk = rules_builder(advanced_config)
+        else:
+            rebulk = rules_builder(advanced_config, includes, excludes)
+        _rulesets[key] = rebulk
+        while len(_rulesets) > _rulesets_maxsize:
+            _rulesets.popitem(last=False)
+    else:
+        _rulesets.move_to_end(key)
+    return rebulk
+
+
+# Command line options that don't change guesses.
+_unguessed_options = frozenset(['filename', 'input_file', 'jobs', 'verbose', 'show_property', 'json', 'yaml', 'ndjson',
+                                'cache', 'serve', 'listen', 'properties', 'values', 'version'])
+
+
+class GuessItApi:  # pylint:disable=too-many-instance-attributes
     """
     An api class that can be configured with custom Rebulk configuration.
     """
 
-    def __init__(self):
-        """Default constructor."""
+    def __init__(self, cache=None):
+        """
+        Default constructor.
+
+        :param cache: guess results cache, maximum number of guesses to keep in an in-memory LRU cache, or filepath
+        of a persistent sqlite cache.
+        :type cache: int|str|Path|LRUCache|SqliteCache
+        """
         self.rebulk = None
+        self.rules_builder = None
         self.config = None
         self.load_config_options = None
+        self.config_hash = None
         self.advanced_config = None
+        self.advanced_config_hash = None
+        if isinstance(cache, int):
+            cache = LRUCache(cache)
+        elif isinstance(cache, (str, os.PathLike)):
+            cache = SqliteCache(cache)
+        self.cache = cache
 
     def reset(self):
         """
         Reset api internal state.
         """
-        self.__init__()  # pylint:disable=unnecessary-dunder-call
+        cache = self.cache
+        self._clear_cache()
+        self.__init__(cache)  # pylint:disable=unnecessary-dunder-call
+
+    def _clear_cache(self):
+        """
+        Clear in-memory guess results cache.
+
+        Persistent cache entries are kept, as they are keyed by guessit version and configuration, and may be shared
+        with other processes.
+        """
+        if self.cache is not None and not isinstance(self.cache, SqliteCache):
+            self.cache.clear()
+
+    def close(self):
+        """
+        Close the guess results cache, writing its pending entries.
+        """
+        close = getattr(self.cache, 'close', None)
+        if close:
+            close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def cache_stats(self):
+        """
+        Retrieves guess results cache statistics.
+        :return: hits, misses and evictions of the cache, or None if there's no cache.
+        :rtype: dict
+        """
+        if self.cache is None:
+            return None
+        return self.cache.stats()
 
     @classmethod
     def _fix_encoding(cls, value):
@@ -133,6 +264,24 @@ class GuessItApi:
                 return False
         return True
 
+    @classmethod
+    def _hash(cls, value):
+        """
+        Hash of a configuration value.
+        """
+        return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _options_fingerprint(cls, options):
+        """
+        Normalized representation of options, ignoring undefined options and options that don't change guesses.
+        """
+        if options is None or isinstance(options, str):
+            return options
+        options = {option: value for option, value in options.items()
+                   if value is not None and option not in _unguessed_options}
+        return json.dumps(cls._fix_encoding(options), sort_keys=True, default=str)
+
     def configure(self, options=None, rules_builder=None, force=False, sanitize_options=True):
         """
         Load configuration files and initialize rebulk rules if required.
@@ -162,6 +311,7 @@ class GuessItApi:
             config = load_config(options)
             config = self._fix_encoding(config)
             self.load_config_options = options
+            self.config_hash = self._hash(config)
         else:
             config = self.config
 
@@ -172,12 +322,17 @@ class GuessItApi:
 
         if should_build_rebulk:
             self.advanced_config = deepcopy(advanced_config)
-            self.rebulk = rules_builder(advanced_config)
+            self.advanced_config_hash = self._hash(advanced_config)
+            self.rebulk = _ruleset(rules_builder, advanced_config, self.advanced_config_hash, force)
+            self.rules_builder = rules_builder
+
+        if force:
+            self._clear_cache()
 
         self.config = config
         return self.config
 
-    def guessit(self, string, options=None):  # pylint: disable=too-many-branches
+    def guessit(self, string, options=None):
         """
         Retrieves all matches from string as a dict
         :param string: the filename or release name
@@ -188,42 +343,227 @@ class GuessItApi:
         :rtype:
         """
         if isinstance(string, Path):
-            try:
-                # Handle path-like object
-                string = os.fspath(string)
-            except AttributeError:
-                string = str(string)
+            string = self._fspath(string)
 
         try:
-            options = parse_options(options, True)
-            options = self._fix_encoding(options)
-            config = self.configure(options, sanitize_options=False)
-            options = merge_options(config, options)
-            result_decode = False
-            result_encode = False
-
-            if isinstance(string, bytes):
-                string = string.decode('ascii')
-                result_encode = True
-
-            matches = self.rebulk.matches(string, options)
-            if result_decode:
-                for match in matches:
-                    if isinstance(match.value, bytes):
-                        match.value = match.value.decode("utf-8")
-            if result_encode:
-                for match in matches:
-                    if isinstance(match.value, str):
-                        match.value = match.value.encode("ascii")
-            matches_dict = matches.to_dict(options.get('advanced', False), options.get('single_value', False),
-                                           options.get('enforce_list', False))
-            output_input_string = options.get('output_input_string', False)
-            if output_input_string:
-                matches_dict['input_string'] = matches.input_string
-            return matches_dict
+            options, config = self._configure_options(options)
+            fingerprint = self._cache_fingerprint(options)
+            guess = self._cache_get(string, fingerprint)
+            if guess is None:
+                options = merge_options(config, options)
+                guess = self._guess(string, options)
+                self._cache_set(string, fingerprint, guess)
+            return guess
         except Exception as err:
             raise GuessitException(string, options) from err
 
+    def guessit_many(self, strings, options=None):
+        """
+        Retrieves all matches from each string of an iterable as a list of dict.
+
+        Options are parsed, configured and merged once per batch instead of once per string. Each item may also be a
+        (string, options) tuple to override batch options for this item only. Items are grouped by options fingerprint,
+        so that each distinct set of overrides is resolved once.
+
+        A string that fails to be guessed, or whose options are invalid, doesn't abort the batch: a GuessitException is
+        returned at its position instead of the result dict. Results cache, if any, is used for each string.
+        :param strings: the filenames or release names, optionally given as (string, options) tuples
+        :type strings: iterable
+        :param options:
+        :type options: str|dict
+        :return: results in input order
+        :rtype: list
+        """
+        results = {}
+        groups = self._group_items(strings, options, results)
+
+        for item_options, group in groups.values():
+            group_options = item_options or options
+            try:
+                group_options, config = self._configure_options(group_options)
+                fingerprint = self._cache_fingerprint(group_options)
+                group_options = merge_options(config, group_options)
+            except (Exception, SystemExit):  # pylint:disable=broad-except
+                for index, string in group:
+                    results[index] = GuessitException(string, group_options)
+                continue
+
+            strings = [string for _, string in group]
+            guessed = []
+            for (index, string), guess in zip(group, self._cache_get_many(strings, fingerprint)):
+                if guess is None:
+                    try:
+                        guess = self._guess(string, group_options)
+                        guessed.append((string, guess))
+                    except Exception:  # pylint:disable=broad-except
+                        guess = GuessitException(string, group_options)
+                results[index] = guess
+            self._cache_set_many(guessed, fingerprint)
+
+        return [results[index] for index in range(len(results))]
+
+    def _group_items(self, items, options, results):
+        """
+        Group guessit_many items by options fingerprint, parsing and merging options of each item with batch options.
+        :param items: strings, or (string, options) tuples
+        :type items: iterable
+        :param options: batch options
+        :type options: str|dict
+        :param results: results by item index, where a GuessitException is set for items whose options are invalid.
+        :type results: dict
+        :return: (merged options, [(index, string)]) tuples, keyed by options fingerprint
+        :rtype: OrderedDict
+        """
+        groups = OrderedDict()
+        for index, item in enumerate(items):
+            item_options = None
+            try:
+                string, item_options = self._split_item(item)
+                if item_options:
+                    item_options = merge_options(parse_options(options, True), parse_options(item_options, True))
+            except (Exception, SystemExit):  # pylint:disable=broad-except
+                results[index] = GuessitException(item, item_options)
+                continue
+            groups.setdefault(self._options_fingerprint(item_options), (item_options, []))[1].append((index, string))
+        return groups
+
+    @classmethod
+    def _split_item(cls, item):
+        """
+        Split a guessit_many item into its string and its options.
+        :param item: string, or (string, options) tuple
+        :type item: str|Path|tuple
+        :return: string and options, or None if item has no options.
+        :rtype: tuple
+        """
+        string, item_options = item if isinstance(item, tuple) else (item, None)
+        if isinstance(string, Path):
+            string = cls._fspath(string)
+        return string, item_options
+
+    @classmethod
+    def _fspath(cls, string):
+        try:
+            # Handle path-like object
+            return os.fspath(string)
+        except AttributeError:
+            return str(string)
+
+    def _configure_options(self, options):
+        """
+        Parse options and configure rebulk.
+        :param options:
+        :type options: str|dict
+        :return: parsed options and loaded configuration
+        :rtype: tuple
+        """
+        options = parse_options(options, True)
+        options = self._fix_encoding(options)
+        config = self.configure(options, sanitize_options=False)
+        return options, config
+
+    def _resolve_options(self, options):
+        """
+        Parse options, configure rebulk and merge options with loaded configuration.
+        :param options:
+        :type options: str|dict
+        :return: options ready to be used for matching
+        :rtype: dict
+        """
+        options, config = self._configure_options(options)
+        return merge_options(config, options)
+
+    def _cache_fingerprint(self, options):
+        """
+        Fingerprint of parsed options, loaded configuration and advanced configuration used as part of the cache key.
+
+        Options are merged with the loaded configuration before guessing, so the configuration contents are part of the
+        fingerprint, and guesses cached with previous contents of configuration files are not returned.
+        :param options: parsed options
+        :type options: dict
+        :return: the fingerprint, or None if there's no cache.
+        :rtype: tuple
+        """
+        if self.cache is None:
+            return None
+        return self._options_fingerprint(options), self.config_hash, self.advanced_config_hash
+
+    def _cache_get(self, string, fingerprint):
+        if fingerprint is None:
+            return None
+        return self.cache.get((string,) + fingerprint)
+
+    def _cache_get_many(self, strings, fingerprint):
+        if fingerprint is None:
+            return [None] * len(strings)
+        return self.cache.get_many([(string,) + fingerprint for string in strings])
+
+    def _cache_set(self, string, fingerprint, guess):
+        if fingerprint is not None:
+            self.cache.set((string,) + fingerprint, guess)
+
+    def _cache_set_many(self, guesses, fingerprint):
+        if fingerprint is not None and guesses:
+            self.cache.set_many([((string,) + fingerprint, guess) for string, guess in guesses])
+
+    def _guess(self, string, options):
+        """
+        Retrieves all matches from string as a dict, using already resolved options.
+        :param string: the filename or release name
+        :type string: str|Path
+        :param options: resolved options
+        :type options: dict
+        :return:
+        :rtype:
+        """
+        if isinstance(string, Path):
+            string = self._fspath(string)
+
+        result_decode = False
+        result_encode = False
+
+        if isinstance(string, bytes):
+            string = string.decode('ascii')
+            result_encode = True
+
+        # Analysis of the input string is shared by all properties modules through the context.
+        context = dict(options)
+        context['input_analysis'] = InputAnalysis(string)
+        matches = self._rebulk_for(options).matches(string, context)
+        if result_decode:
+            for match in matches:
+                if isinstance(match.value, bytes):
+                    match.value = match.value.decode("utf-8")
+        if result_encode:
+            for match in matches:
+                if isinstance(match.value, str):
+                    match.value = match.value.encode("ascii")
+        matches_dict = matches.to_dict(options.get('advanced', False), options.get('single_value', False),
+                                       options.get('enforce_list', False))
+        output_input_string = options.get('output_input_string', False)
+        if output_input_string:
+            matches_dict['input_string'] = matches.input_string
+        return matches_dict
+
+    def _rebulk_for(self, options):
+        """
+        Rules to use with resolved options.
+
+        When some properties are disabled with includes or excludes, rules are built without the modules that can't
+        guess any enabled property, once for each includes and excludes set.
+        :param options: resolved options
+        :type options: dict
+        :return:
+        :rtype: Rebulk
+        """
+        includes = options.get('includes')
+        excludes = options.get('excludes')
+        if not includes and not excludes or self.rules_builder is not rebulk_builder or \
+                isinstance(includes, str) or isinstance(excludes, str):
+            return self.rebulk
+        return _ruleset(self.rules_builder, self.advanced_config, self.advanced_config_hash,
+                        includes=frozenset(includes or ()), excludes=frozenset(excludes or ()))
+
     def properties(self, options=None):
         """
         Grab properties and values that can be generated.
@@ -232,10 +572,7 @@ class GuessItApi:
         :return:
         :rtype:
         """
-        options = parse_options(options, True)
-        options = self._fix_encoding(options)
-        config = self.configure(options, sanitize_options=False)
-        options = merge_options(config, options)
+        options = self._resolve_options(options)
         unordered = introspect(self.rebulk, options).properties
         ordered = OrderedDict()
         for k in sorted(unordered.keys(), key=str):
@@ -0,0 +1,412 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Guess results caches
+"""
+import copy
+import hashlib
+import json
+import os
+import pickle
+import threading
+import weakref
+from collections import OrderedDict
+
+from rebulk.match import Match, MatchesDict
+
+from .__version__ import __version__
+
+
+def copy_guess(guess):
+    """
+    Copy a guess result, so that it can be mutated without altering the cached one.
+
+    Lists are copied, and so are the Match values of advanced guesses.
+    :param guess:
+    :type guess: dict
+    :return:
+    :rtype: dict
+    """
+    copied = copy.copy(guess)
+    for key, value in copied.items():
+        if isinstance(value, list):
+            copied[key] = [_copy_value(item) for item in value]
+        else:
+            copied[key] = _copy_value(value)
+    return copied
+
+
+def _copy_value(value):
+    """
+    Copy a Match value of a guess result. Other values are returned as is.
+    """
+    if isinstance(value, Match):
+        return copy.copy(value)
+    return value
+
+
+class LRUCache:
+    """
+    In-memory guess results cache, evicting least recently used entries when maxsize is reached.
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        :param maxsize: maximum number of entries
+        :type maxsize: int
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be greater than 0')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """
+        Get a copy of the cached guess for given key.
+        :param key:
+        :type key: tuple
+        :return: the cached guess, or None if key is not cached.
+        :rtype: dict
+        """
+        guess = self._entries.get(key)
+        if guess is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return copy_guess(guess)
+
+    def get_many(self, keys):
+        """
+        Get a copy of the cached guess for each given key.
+        :param keys:
+        :type keys: list
+        :return: the cached guesses, with None for keys that are not cached.
+        :rtype: list
+        """
+        return [self.get(key) for key in keys]
+
+    def set(self, key, guess):
+        """
+        Cache a copy of the guess for given key.
+        :param key:
+        :type key: tuple
+        :param guess:
+        :type guess: dict
+        """
+        self._entries[key] = copy_guess(guess)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def set_many(self, entries):
+        """
+        Cache a copy of each guess.
+        :param entries: (key, guess) tuples
+        :type entries: list
+        """
+        for key, guess in entries:
+            self.set(key, guess)
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        self._entries.clear()
+
+    def stats(self):
+        """
+        Cache statistics.
+        :return: hits, misses, evictions, size and maxsize of the cache
+        :rtype: dict
+        """
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'maxsize': self.maxsize}
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _write_entries(connection, pending):
+    """
+    Write pending entries to the database, inserting missing rows and updating others.
+    :param connection:
+    :type connection: sqlite3.Connection
+    :param pending: serialized guesses, keyed by (input_string, config_hash)
+    :type pending: dict
+    :return: number of inserted rows
+    :rtype: int
+    """
+    rows = [(data, string, config_hash, __version__) for (string, config_hash), data in pending.items()]
+    inserted = connection.executemany('INSERT OR IGNORE INTO guesses '
+                                      '(guess, input_string, config_hash, version) VALUES (?, ?, ?, ?)',
+                                      rows).rowcount
+    if inserted < len(rows):
+        connection.executemany('UPDATE guesses SET guess = ? '
+                               'WHERE input_string = ? AND config_hash = ? AND version = ?', rows)
+    pending.clear()
+    return inserted
+
+
+def _close_database(connection, lock, pending):
+    """
+    Write pending entries and close the database of a SqliteCache that is closed, garbage collected, or still open
+    when the interpreter exits.
+    """
+    with lock:
+        if pending:
+            with connection:
+                _write_entries(connection, pending)
+        connection.close()
+
+
+class SqliteCache:  # pylint:disable=too-many-instance-attributes
+    """
+    Persistent guess results cache, stored in a local sqlite database file.
+
+    Entries are keyed by input string, guessit version and a hash of options and advanced configuration, so entries
+    written by another guessit version or with another configuration are never returned. Entries from other guessit
+    versions are removed when the database is opened.
+
+    Writes are buffered and committed in a single transaction every batch_size entries, and when the cache is
+    flushed or closed. Pending writes of a cache that isn't closed are committed when it's garbage collected or when the
+    interpreter exits. When maxsize is given, oldest entries are removed to keep at most maxsize entries. Entries are
+    counted when the database is opened, so entries written afterwards by other processes are not taken into account.
+
+    The database connection is shared by all threads, and guarded by a lock.
+
+    Guesses are serialized with pickle, so the database file should not be shared with untrusted users. Guesses that
+    can't be pickled, like advanced guesses, are not cached.
+    """
+
+    _max_variables = 500
+
+    def __init__(self, path, maxsize=None, batch_size=256):
+        """
+        :param path: database filepath
+        :type path: str|Path
+        :param maxsize: maximum number of entries
+        :type maxsize: int
+        :param batch_size: number of entries to buffer before committing them
+        :type batch_size: int
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError('maxsize must be greater than 0')
+        self.path = os.fspath(path)
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pending = OrderedDict()
+        self._lock = threading.RLock()
+        import sqlite3  # pylint:disable=import-outside-toplevel
+        self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS guesses ('
+                                     'input_string NOT NULL, '
+                                     'config_hash TEXT NOT NULL, '
+                                     'version TEXT NOT NULL, '
+                                     'guess BLOB NOT NULL, '
+                                     'PRIMARY KEY (input_string, config_hash, version))')
+            self._connection.execute('DELETE FROM guesses WHERE version != ?', (__version__,))
+        self._size = self._stored_count()
+        self._finalizer = weakref.finalize(self, _close_database, self._connection, self._lock, self._pending)
+
+    @classmethod
+    def _entry_key(cls, key):
+        """
+        Convert a cache key to an (input_string, config_hash) database key.
+        :return: database key, or None if input string can't be stored.
+        :rtype: tuple
+        """
+        string = key[0]
+        if not isinstance(string, (str, bytes)):
+            return None
+        config_hash = hashlib.sha1(json.dumps(list(key[1:]), default=str).encode('utf-8')).hexdigest()
+        return string, config_hash
+
+    @classmethod
+    def _dumps(cls, guess):
+        try:
+            return pickle.dumps(list(guess.items()), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return None
+
+    @classmethod
+    def _loads(cls, data):
+        guess = MatchesDict()
+        guess.update(pickle.loads(data))
+        return guess
+
+    def _count(self, data):
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._loads(data)
+
+    def get(self, key):
+        """
+        Get the cached guess for given key.
+        :param key:
+        :type key: tuple
+        :return: the cached guess, or None if key is not cached.
+        :rtype: dict
+        """
+        return self.get_many([key])[0]
+
+    def get_many(self, keys):
+        """
+        Get the cached guess for each given key, reading database by batches.
+        :param keys:
+        :type keys: list
+        :return: the cached guesses, with None for keys that are not cached.
+        :rtype: list
+        """
+        entry_keys = [self._entry_key(key) for key in keys]
+
+        with self._lock:
+            found = {}
+            missing = []
+            for entry_key in entry_keys:
+                if entry_key is None:
+                    continue
+                if entry_key in self._pending:
+                    found[entry_key] = self._pending[entry_key]
+                else:
+                    missing.append(entry_key)
+            found.update(self._select(missing))
+
+            return [self._count(found.get(entry_key)) for entry_key in entry_keys]
+
+    def _select(self, entry_keys):
+        """
+        Read stored guesses by batches.
+        :param entry_keys: (input_string, config_hash) database keys
+        :type entry_keys: list
+        :return: serialized guesses found in the database, keyed by database key.
+        :rtype: dict
+        """
+        strings_by_hash = OrderedDict()
+        for string, config_hash in entry_keys:
+            strings_by_hash.setdefault(config_hash, []).append(string)
+
+        found = {}
+        for config_hash, strings in strings_by_hash.items():
+            for i in range(0, len(strings), self._max_variables):
+                chunk = strings[i:i + self._max_variables]
+                rows = self._connection.execute('SELECT input_string, guess FROM guesses '
+                                                'WHERE version = ? AND config_hash = ? '
+                                                f'AND input_string IN ({", ".join("?" * len(chunk))})',
+                                                [__version__, config_hash] + chunk)
+                for string, data in rows:
+                    found[(string, config_hash)] = data
+        return found
+
+    def set(self, key, guess):
+        """
+        Cache the guess for given key. It's written to the database when batch_size entries are pending.
+        :param key:
+        :type key: tuple
+        :param guess:
+        :type guess: dict
+        """
+        entry_key = self._entry_key(key)
+        data = self._dumps(guess)
+        if entry_key is None or data is None:
+            return
+        with self._lock:
+            self._pending[entry_key] = data
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def set_many(self, entries):
+        """
+        Cache each guess, writing them to the database in a single transaction.
+        :param entries: (key, guess) tuples
+        :type entries: list
+        """
+        with self._lock:
+            for key, guess in entries:
+                entry_key = self._entry_key(key)
+                data = self._dumps(guess)
+                if entry_key is not None and data is not None:
+                    self._pending[entry_key] = data
+            self.flush()
+
+    def flush(self):
+        """
+        Write pending entries to the database, and remove oldest entries if maxsize is exceeded.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            with self._connection:
+                # Rows are inserted when missing and updated otherwise, so that the number of stored entries is
+                # tracked without counting them on each flush.
+                self._size += _write_entries(self._connection, self._pending)
+                if self.maxsize and self._size > self.maxsize:
+                    evicted = self._connection.execute('DELETE FROM guesses WHERE rowid IN '
+                                                       '(SELECT rowid FROM guesses ORDER BY rowid LIMIT ?)',
+                                                       (self._size - self.maxsize,)).rowcount
+                    self.evictions += evicted
+                    self._size -= evicted
+
+    def vacuum(self):
+        """
+        Write pending entries and rebuild the database file to reclaim unused space.
+        """
+        with self._lock:
+            self.flush()
+            self._connection.execute('VACUUM')
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        with self._lock:
+            self._pending.clear()
+            with self._connection:
+                self._connection.execute('DELETE FROM guesses')
+            self._size = 0
+
+    def stats(self):
+        """
+        Cache statistics.
+        :return: hits, misses, evictions, size and maxsize of the cache
+        :rtype: dict
+        """
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self),
+                'maxsize': self.maxsize}
+
+    def close(self):
+        """
+        Write pending entries and close the database.
+        """
+        with self._lock:
+            self.flush()
+            self._finalizer()
+
+    def _stored_count(self):
+        return self._connection.execute('SELECT COUNT(*) FROM guesses').fetchone()[0]
+
+    def __len__(self):
+        with self._lock:
+            return self._stored_count() + len(self._pending) - len(self._select(list(self._pending)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
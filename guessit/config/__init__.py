@@ -131,6 +131,8 @@ def load_config_patterns(rebulk: Rebulk,
         entries = raw_entries if isinstance(raw_entries, list) else [raw_entries]
         for entry in entries:
             if isinstance(entry, dict) and "callable" in entry.keys():
+                # Config is left untouched, so that rules can be built again from it.
+                entry = dict(entry)
                 _process_callable_entry(entry.pop("callable"), rebulk, entry)
                 continue
             entry_decl = _build_entry_decl(entry, options, value)
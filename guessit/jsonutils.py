@@ -4,10 +4,12 @@
 JSON Utils
 """
 import json
+import time
 
 from six import text_type
 from rebulk.match import Match
 
+
 class GuessitEncoder(json.JSONEncoder):
     """
     JSON Encoder for guessit response
@@ -20,3 +22,66 @@ class GuessitEncoder(json.JSONEncoder):
             return text_type(o.name)
         # pragma: no cover
         return text_type(o)
+
+
+class NdjsonWriter:
+    """
+    Write guesses as newline delimited JSON, one compact JSON object per line.
+
+    Lines are buffered and written to the stream every buffer_size lines, or when flush_interval seconds have elapsed
+    since the last write, so that consumers still get guesses while the input is processed. Each line is written as
+    soon as it's encoded when the stream is a terminal. Remaining lines are written when the writer is flushed.
+    """
+
+    def __init__(self, stream, buffer_size=1024, flush_interval=1.0):
+        """
+        :param stream: text stream to write to
+        :type stream: io.TextIOBase
+        :param buffer_size: maximum number of lines to buffer
+        :type buffer_size: int
+        :param flush_interval: maximum number of seconds a line is kept in the buffer while guessing next ones
+        :type flush_interval: float
+        """
+        self.stream = stream
+        self.buffer_size = 1 if _isatty(stream) else buffer_size
+        self.flush_interval = flush_interval
+        self._encoder = GuessitEncoder(ensure_ascii=False, separators=(',', ':'))
+        self._lines = []
+        self._flushed = time.monotonic()
+
+    def write(self, input_string, guess):
+        """
+        Write a guess for given input string.
+        :param input_string:
+        :type input_string: str
+        :param guess:
+        :type guess: dict
+        """
+        data = dict(guess)
+        data.setdefault('input_string', input_string)
+        self._lines.append(self._encoder.encode(data) + '\n')
+        if len(self._lines) >= self.buffer_size or time.monotonic() - self._flushed >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Write buffered lines and flush the stream.
+        """
+        if self._lines:
+            self.stream.write(''.join(self._lines))
+            self._lines.clear()
+        self.stream.flush()
+        self._flushed = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+
+
+def _isatty(stream):
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
@@ -8,23 +8,25 @@ import json
 import os
 import shlex
 import sys
-from argparse import ArgumentParser
+from importlib.util import find_spec
 
-# importlib.resources.read_text() is deprecated since Python 3.11.
-# importlib.resources.files() is new in Python 3.9.
-if sys.version_info >= (3, 9, 0):
-    from importlib.resources import files
 
-    def read_text(package, filename):
-        """
-        Should behave like deprecated importlib.resources.read_text()
-        """
+def read_text(package, filename):
+    """
+    Should behave like deprecated importlib.resources.read_text()
+    """
+    # importlib.resources is imported only when configuration is loaded.
+    # importlib.resources.read_text() is deprecated since Python 3.11.
+    # importlib.resources.files() is new in Python 3.9.
+    # pylint:disable=import-outside-toplevel
+    if sys.version_info >= (3, 9, 0):
+        from importlib.resources import files
         return files(package).joinpath(filename).read_text()  # pylint:disable=unspecified-encoding
-else:
     try:
-        from importlib.resources import read_text
+        from importlib.resources import read_text as _read_text
     except ImportError:
-        from importlib_resources import read_text
+        from importlib_resources import read_text as _read_text
+    return _read_text(package, filename)
 
 
 def build_argument_parser():
@@ -33,6 +35,8 @@ def build_argument_parser():
     :return: the argument parser
     :rtype: ArgumentParser
     """
+    from argparse import ArgumentParser  # pylint:disable=import-outside-toplevel
+
     opts = ArgumentParser()
     opts.add_argument(dest='filename', help='Filename or release name to guess', nargs='*')
 
@@ -64,7 +68,10 @@ def build_argument_parser():
 
     input_opts = opts.add_argument_group("Input")
     input_opts.add_argument('-f', '--input-file', dest='input_file', default=None,
-                            help='Read filenames from an input text file. File should use UTF-8 charset.')
+                            help='Read filenames from an input text file, or from standard input if "-". '
+                                 'File should use UTF-8 charset.')
+    input_opts.add_argument('-J', '--jobs', dest='jobs', type=int, default=None,
+                            help='Number of worker processes used to guess filenames in parallel.')
 
     output_opts = opts.add_argument_group("Output")
     output_opts.add_argument('-v', '--verbose', action='store_true', dest='verbose', default=None,
@@ -81,6 +88,9 @@ def build_argument_parser():
                              help='Display information for filename guesses as json output')
     output_opts.add_argument('-y', '--yaml', dest='yaml', action='store_true', default=None,
                              help='Display information for filename guesses as yaml output')
+    output_opts.add_argument('--ndjson', dest='ndjson', action='store_true', default=None,
+                             help='Display information for filename guesses as newline delimited json output, '
+                                  'with one compact json object per line including the input string')
     output_opts.add_argument('-i', '--output-input-string', dest='output_input_string', action='store_true',
                              default=False, help='Add input_string property in the output')
 
@@ -100,6 +110,17 @@ def build_argument_parser():
                                 'configuration through user configuration or --config option. If no "advanced_config" '
                                 'is provided by another configuration file, it will still be loaded from default '
                                 'configuration.')
+    conf_opts.add_argument('--cache', dest='cache', default=None,
+                           help='Filepath to a sqlite database used to cache guesses between runs. Cached guesses are '
+                                'invalidated when guessit version or configuration changes.')
+
+    server_opts = opts.add_argument_group("Server")
+    server_opts.add_argument('--serve', dest='serve', action='store_true', default=None,
+                             help='Serve guesses from a local JSON endpoint, keeping rules loaded between requests. '
+                                  'Can be used with --cache, but not with filenames or --input-file.')
+    server_opts.add_argument('--listen', dest='listen', default=None,
+                             help='Address to listen on with --serve, as "host:port" or as a unix socket path. '
+                                  'Defaults to 127.0.0.1:8910.')
 
     information_opts = opts.add_argument_group("Information")
     information_opts.add_argument('-p', '--properties', dest='properties', action='store_true', default=None,
@@ -125,18 +146,37 @@ def parse_options(options=None, api=False):
     """
     if isinstance(options, str):
         args = shlex.split(options)
-        options = vars(argument_parser.parse_args(args))
+        options = vars(get_argument_parser().parse_args(args))
     elif options is None:
         if api:
             options = {}
         else:
-            options = vars(argument_parser.parse_args())
+            options = vars(get_argument_parser().parse_args())
     elif not isinstance(options, dict):
-        options = vars(argument_parser.parse_args(options))
+        options = vars(get_argument_parser().parse_args(options))
     return options
 
 
-argument_parser = build_argument_parser()
+_argument_parser = None
+
+
+def get_argument_parser():
+    """
+    Get the argument parser, building it on first use.
+    :return: the argument parser
+    :rtype: ArgumentParser
+    """
+    global _argument_parser  # pylint:disable=global-statement
+    if _argument_parser is None:
+        _argument_parser = build_argument_parser()
+    return _argument_parser
+
+
+def __getattr__(name):
+    # argument_parser is built lazily, as it's only required by command line and string options.
+    if name == 'argument_parser':
+        return get_argument_parser()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 class ConfigurationException(Exception):
@@ -166,12 +206,8 @@ def load_config(options):
     if not options.get('no_user_config'):
         home_directory = os.path.expanduser("~")
         cwd = os.getcwd()
-        yaml_supported = False
-        try:
-            import yaml  # pylint:disable=unused-variable,unused-import,import-outside-toplevel
-            yaml_supported = True
-        except ImportError:
-            pass
+        # yaml is only imported when a yaml configuration file is loaded.
+        yaml_supported = find_spec('yaml') is not None
 
         config_file_locations = get_options_file_locations(home_directory, cwd, yaml_supported)
         config_files = [f for f in config_file_locations if os.path.exists(f)]
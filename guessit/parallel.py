@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Parallel engine, spreading guesses over a pool of worker processes.
+"""
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+
+from rebulk.match import Match, MatchesDict
+
+from .api import GuessItApi
+
+default_chunk_size = 256
+
+_worker_api = None
+_worker_options = None
+
+
+def _initialize_worker(options, cache):
+    """
+    Initialize a worker process, building rebulk rules once for all the tasks it will run.
+    :param options:
+    :type options: str|dict
+    :param cache:
+    :type cache: int|str
+    """
+    global _worker_api, _worker_options  # pylint:disable=global-statement
+    _worker_api = GuessItApi(cache)
+    _worker_api.configure(options)
+    _worker_options = options
+
+
+def _frozen_value(value, _):
+    """
+    Formatter of matches sent back from worker processes, returning the value computed in the worker.
+    """
+    return value
+
+
+def _transferable_match(match):
+    """
+    Copy a match so that it can be sent back from a worker process.
+
+    Patterns, formatters and parent matches of a match can't be pickled, so the copy only keeps its name, tags,
+    position, raw position and value, with the input string.
+    :param match:
+    :type match: Match
+    :return:
+    :rtype: Match
+    """
+    copied = Match(match.start, match.end, name=match.name, tags=list(match.tags), private=match.private,
+                   input_string=match.input_string, formatter=partial(_frozen_value, match.value))
+    copied.raw_start = match.raw_start
+    copied.raw_end = match.raw_end
+    return copied
+
+
+def _transferable(value):
+    """
+    Convert a guess value to something that can be sent back from a worker process.
+    """
+    if isinstance(value, list):
+        return [_transferable(item) for item in value]
+    if isinstance(value, Match):
+        return _transferable_match(value)
+    return value
+
+
+def _transferable_guess(guess):
+    """
+    Convert a guess result to something that can be sent back from a worker process.
+    :param guess:
+    :type guess: MatchesDict
+    :return:
+    :rtype: MatchesDict
+    """
+    transferable = MatchesDict()
+    transferable.update((key, _transferable(value)) for key, value in guess.items())
+    return transferable
+
+
+def _guess_chunk(strings):
+    """
+    Guess a chunk of strings in a worker process.
+    :param strings:
+    :type strings: list
+    :return:
+    :rtype: list
+    """
+    results = _worker_api.guessit_many(strings, _worker_options)
+    return [result if isinstance(result, Exception) else _transferable_guess(result) for result in results]
+
+
+def _chunks(strings, chunk_size):
+    iterator = iter(strings)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class GuessItExecutor:  # pylint:disable=too-many-instance-attributes
+    """
+    Guess strings in parallel using a pool of worker processes.
+
+    Each worker builds rebulk rules once when it starts, and then guesses strings by chunks of chunk_size items. When
+    workers are forked, rules are built once in this process before starting them, and inherited by all workers.
+    Results are yielded in input order. As for `GuessItApi.guessit_many`, a string that fails to be guessed gets a
+    GuessitException instead of its result. Matches of advanced guesses are copies keeping only their name, tags,
+    position, raw position and value, as patterns and parent matches can't be sent back from workers.
+
+    When max_tasks_per_child is given, the pool of workers is replaced after each worker has processed this number of
+    chunks on average, to release the memory retained by long-running workers.
+    """
+
+    def __init__(self, options=None, max_workers=None, chunk_size=default_chunk_size, *, max_tasks_per_child=None,
+                 mp_context=None, cache=None):
+        """
+        :param options: options used to guess all strings
+        :type options: str|dict
+        :param max_workers: number of worker processes, defaults to the number of processors
+        :type max_workers: int
+        :param chunk_size: number of strings sent to a worker at once
+        :type chunk_size: int
+        :param max_tasks_per_child: number of chunks processed by each worker before it's replaced
+        :type max_tasks_per_child: int
+        :param mp_context: multiprocessing context used to start workers
+        :param cache: size of each worker in-memory LRU cache, or filepath of a sqlite cache shared by workers
+        :type cache: int|str
+        """
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be greater than 0')
+        if max_tasks_per_child is not None and max_tasks_per_child < 1:
+            raise ValueError('max_tasks_per_child must be greater than 0')
+
+        self.options = options
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_tasks_per_child = max_tasks_per_child
+        self.mp_context = mp_context
+        self.cache = cache
+
+        self._executor = None
+        self._executor_tasks = 0
+
+    def _submit(self, chunk):
+        if self._executor and self.max_tasks_per_child and \
+                self._executor_tasks >= self.max_tasks_per_child * self.max_workers:
+            # Workers finish already submitted chunks and exit before new ones are started, so that there are never
+            # more than max_workers processes running.
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if not self._executor:
+            self._preload()
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self.mp_context,
+                                                 initializer=_initialize_worker, initargs=(self.options, self.cache))
+            self._executor_tasks = 0
+
+        self._executor_tasks += 1
+        return self._executor.submit(_guess_chunk, chunk)
+
+    def _preload(self):
+        context = self.mp_context or multiprocessing.get_context()
+        if context.get_start_method() == 'fork':
+            # Forked workers inherit rules built in this process, and don't have to build them.
+            GuessItApi().configure(self.options)
+
+    def map(self, strings):
+        """
+        Guess all strings, yielding results in input order.
+
+        Strings are consumed lazily, so that only a bounded number of chunks are in flight at once.
+        :param strings: the filenames or release names, optionally given as (string, options) tuples
+        :type strings: iterable
+        :return:
+        :rtype: iterator
+        """
+        pending = deque()
+        for chunk in _chunks(strings, self.chunk_size):
+            pending.append(self._submit(chunk))
+            if len(pending) >= 2 * self.max_workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+    def shutdown(self, wait=True):
+        """
+        Stop worker processes.
+        :param wait: wait for pending chunks to be processed
+        :type wait: bool
+        """
+        if self._executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+
+def guessit_parallel(strings, options=None, **kwargs):
+    """
+    Retrieves all matches from each string of an iterable, using a pool of worker processes.
+    :param strings: the filenames or release names, optionally given as (string, options) tuples
+    :type strings: iterable
+    :param options:
+    :type options: str|dict
+    :param kwargs: GuessItExecutor parameters (max_workers, chunk_size, max_tasks_per_child, mp_context, cache)
+    :return: results in input order
+    :rtype: list
+    """
+    with GuessItExecutor(options, **kwargs) as executor:
+        return list(executor.map(strings))
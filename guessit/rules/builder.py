@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Rebulk object default builder, importing all properties modules
+"""
+from rebulk import Rebulk
+
+from .markers.path import path
+from .markers.groups import groups
+
+from .properties.episodes import episodes
+from .properties.container import container
+from .properties.source import source
+from .properties.video_codec import video_codec
+from .properties.audio_codec import audio_codec
+from .properties.screen_size import screen_size
+from .properties.website import website
+from .properties.date import date
+from .properties.title import title
+from .properties.episode_title import episode_title
+from .properties.language import language
+from .properties.country import country
+from .properties.release_group import release_group
+from .properties.streaming_service import streaming_service
+from .properties.other import other
+from .properties.size import size
+from .properties.bit_rate import bit_rate
+from .properties.edition import edition
+from .properties.cd import cd
+from .properties.bonus import bonus
+from .properties.film import film
+from .properties.part import part
+from .properties.crc import crc
+from .properties.mimetype import mimetype
+from .properties.type import type_
+
+from .processors import processors
+from .common.keywords import use_keyword_automaton
+from .common.pattern import is_disabled
+
+
+# Rules modules in execution order, with the properties enabling them. Patterns and rules of a module only run when
+# one of those properties is enabled, so a module with all its properties disabled has no effect on other modules,
+# and is not built. Modules with no properties always run, as they find matches used by all other modules, or guess
+# properties that can't be disabled.
+rules_modules = (
+    ('path', path, None),
+    ('groups', groups, None),
+    ('episodes', episodes, ('season', 'episode', 'episode_details', 'episode_format', 'version', 'disc')),
+    ('container', container, ('container',)),
+    ('source', source, ('source',)),
+    ('video_codec', video_codec, ('video_codec', 'video_profile', 'video_api', 'color_depth')),
+    ('audio_codec', audio_codec, ('audio_codec', 'audio_profile', 'audio_channels')),
+    ('screen_size', screen_size, ('screen_size', 'frame_rate', 'aspect_ratio')),
+    ('website', website, ('website',)),
+    ('date', date, None),
+    ('title', title, ('title',)),
+    ('episode_title', episode_title, ('episode_title',)),
+    ('language', language, ('language', 'subtitle_language')),
+    ('country', country, ('country',)),
+    ('release_group', release_group, ('release_group',)),
+    ('streaming_service', streaming_service, ('streaming_service',)),
+    ('other', other, ('other',)),
+    ('size', size, ('size',)),
+    ('bit_rate', bit_rate, ('audio_bit_rate', 'video_bit_rate')),
+    ('edition', edition, ('edition',)),
+    ('cd', cd, ('cd',)),
+    ('bonus', bonus, ('bonus',)),
+    ('film', film, ('film',)),
+    ('part', part, ('part',)),
+    ('crc', crc, ('crc32',)),
+    ('processors', processors, None),
+    ('mimetype', mimetype, ('mimetype',)),
+    ('type', type_, ('type',)),
+)
+
+
+def rules_plan(includes=None, excludes=None):
+    """
+    Names of rules modules to build for given enabled properties, in execution order.
+    :param includes: properties to guess, all properties if empty.
+    :type includes: list
+    :param excludes: properties not to guess.
+    :type excludes: list
+    :return:
+    :rtype: list
+    """
+    context = {'includes': includes, 'excludes': excludes}
+    return [name for name, _, properties in rules_modules
+            if properties is None or not all(is_disabled(context, prop) for prop in properties)]
+
+
+def rebulk_builder(config, includes=None, excludes=None):
+    """
+    Default builder for main Rebulk object used by api.
+
+    When includes or excludes are given, modules that can't guess any enabled property are left out. Case-insensitive
+    string patterns of all modules share a single keywords automaton, finding all their strings in one pass.
+    :param config: advanced configuration
+    :type config: dict
+    :param includes: properties to guess, all properties if empty.
+    :type includes: list
+    :param excludes: properties not to guess.
+    :type excludes: list
+    :return: Main Rebulk object
+    :rtype: Rebulk
+    """
+    plan = frozenset(rules_plan(includes, excludes))
+    common_words = frozenset(config.get('common_words', {}))
+
+    rebulk = Rebulk()
+    for name, module, _ in rules_modules:
+        if name not in plan:
+            continue
+        if name in ('language', 'country'):
+            rebulk.rebulk(module(config.get(name, {}), common_words))
+        elif name == 'mimetype':
+            rebulk.rebulk(module(config.get(name, {}), config.get('container', {})))
+        else:
+            rebulk.rebulk(module(config.get(name, {})))
+    use_keyword_automaton(rebulk.effective_patterns({}))
+
+    def customize_properties(properties):
+        """
+        Customize default rebulk properties
+        """
+        count = properties['count']
+        del properties['count']
+
+        properties['season_count'] = count
+        properties['episode_count'] = count
+
+        return properties
+
+    rebulk.customize_properties = customize_properties
+
+    return rebulk
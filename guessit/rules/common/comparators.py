@@ -4,8 +4,6 @@
 Comparators
 """
 
-from functools import cmp_to_key
-
 
 def marker_comparator_predicate(match):
     """
@@ -60,7 +58,9 @@ def marker_comparator(matches, markers, predicate):
 
 def marker_sorted(markers, matches, predicate=marker_comparator_predicate):
     """
-    Sort markers from matches, from the most valuable to the less.
+    Sort markers from matches, from the most valuable to the less, as `marker_comparator` does.
+
+    Weight and position of each marker are computed once, instead of on each comparison.
 
     :param markers:
     :type markers:
@@ -70,4 +70,7 @@ def marker_sorted(markers, matches, predicate=marker_comparator_predicate):
     :return:
     :rtype:
     """
-    return sorted(markers, key=cmp_to_key(marker_comparator(matches, markers, predicate=predicate)))
+    positions = {}
+    for position, marker in enumerate(markers):
+        positions.setdefault(marker, position)
+    return sorted(markers, key=lambda marker: (-marker_weight(matches, marker, predicate), -positions[marker]))
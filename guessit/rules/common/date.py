@@ -3,7 +3,8 @@
 """
 Date
 """
-from dateutil import parser
+import datetime
+import time
 
 from rebulk.remodule import re
 
@@ -28,6 +29,14 @@ date_regexps = [
                # pylint:disable=consider-using-f-string
                re.IGNORECASE)]
 
+# pylint:disable=consider-using-f-string
+_month_name_date_re = re.compile(r'(\d{1,2})(?:st|nd|rd|th)?%s([a-z]{3,10})%s(\d{4})' % (_dsep, _dsep), re.IGNORECASE)
+
+_months = {name: month for month, names in enumerate((
+    ('jan', 'january'), ('feb', 'february'), ('mar', 'march'), ('apr', 'april'), ('may',), ('jun', 'june'),
+    ('jul', 'july'), ('aug', 'august'), ('sep', 'sept', 'september'), ('oct', 'october'), ('nov', 'november'),
+    ('dec', 'december')), 1) for name in names}
+
 
 def valid_year(year):
     """Check if number is a valid year"""
@@ -80,6 +89,90 @@ def _guess_day_first_parameter(groups):  # pylint:disable=inconsistent-return-st
         return True
 
 
+def _convert_year(year, century_specified):
+    """
+    Convert a two digits year to the nearest year from the current one, as dateutil parser does.
+    """
+    if year < 100 and not century_specified:
+        current_year = time.localtime().tm_year
+        year += current_year // 100 * 100
+        if year >= current_year + 50:
+            year -= 100
+        elif year < current_year - 50:
+            year += 100
+    return year
+
+
+def _resolve_ymd(values, year_index, year_first, day_first):
+    """
+    Resolve year, month and day from three numbers, as dateutil parser does.
+
+    :param values: the three numbers
+    :type values: list
+    :param year_index: index of the number that is a year for sure
+    :type year_index: int
+    :return: year, month and day
+    :rtype: tuple
+    """
+    first, second, third = values
+    if first > 31 or year_index == 0 or (year_first and second <= 12 and third <= 31):
+        if day_first and third <= 12:
+            return first, third, second
+        return first, second, third
+    if first > 12 or (day_first and second <= 12):
+        return third, second, first
+    return third, first, second
+
+
+def _dateutil_parse(string, year_first, day_first):
+    """
+    Parse the date with dateutil parser.
+    """
+    # dateutil is slow to import, so it's imported only when a date can't be parsed by guessit.
+    from dateutil import parser  # pylint:disable=import-outside-toplevel
+
+    try:
+        return parser.parse(string, dayfirst=day_first, yearfirst=year_first).date()
+    except (ValueError, TypeError):  # pragma: no cover
+        # see https://bugs.launchpad.net/dateutil/+bug/1247643
+        return None
+
+
+def _parse_date(groups, year_first, day_first):
+    """
+    Build the date from groups of a date regular expression, as dateutil parser would do.
+
+    Dates with a month name that is not known, like a day of week, are left to dateutil parser.
+
+    :param groups: match groups found for the date
+    :type groups: list of match objects
+    :return: the date, or None if groups are not a valid date.
+    :rtype: datetime.date
+    """
+    if len(groups) == 1 and not groups[0].isdigit():
+        month_name_date = _month_name_date_re.fullmatch(groups[0])
+        month = _months.get(month_name_date.group(2).lower()) if month_name_date else None
+        if month is None:
+            return _dateutil_parse(groups[0], year_first, day_first)
+        year, day = int(month_name_date.group(3)), int(month_name_date.group(1))
+    else:
+        if len(groups) == 1:
+            value = groups[0]
+            if len(value) == 8:
+                groups, year_index = (value[:4], value[4:6], value[6:]), 0
+            else:
+                groups, year_index = (value[:2], value[2:4], value[4:]), None
+        else:
+            year_index = next((i for i, group in enumerate(groups) if len(group) > 2), None)
+        year, month, day = _resolve_ymd([int(group) for group in groups], year_index, year_first, day_first)
+        year = _convert_year(year, year_index is not None)
+
+    try:
+        return datetime.date(year, month, day)
+    except ValueError:
+        return None
+
+
 def search_date(string, year_first=None, day_first=None):  # pylint:disable=inconsistent-return-statements
     """Looks for date patterns, and if found return the date and group span.
 
@@ -95,6 +188,9 @@ def search_date(string, year_first=None, day_first=None):  # pylint:disable=inco
     >>> search_date(' And this on 17-06-1998. ')
     (13, 23, datetime.date(1998, 6, 17))
 
+    >>> search_date(' Aired on 1st March 2015. ')
+    (10, 24, datetime.date(2015, 3, 1))
+
     >>> search_date(' no date in here ')
     """
     for date_re in date_regexps:
@@ -104,10 +200,6 @@ def search_date(string, year_first=None, day_first=None):  # pylint:disable=inco
 
         start, end = search_match.start(1), search_match.end(1)
         groups = search_match.groups()[1:]
-        match = '-'.join(groups)
-
-        if match is None:
-            continue
 
         if year_first and day_first is None:
             day_first = False
@@ -124,15 +216,10 @@ def search_date(string, year_first=None, day_first=None):  # pylint:disable=inco
         if day_first is not None:
             dayfirst_opts = [day_first]
 
-        kwargs_list = ({'dayfirst': d, 'yearfirst': y}
-                       for d in dayfirst_opts for y in yearfirst_opts)
-        for kwargs in kwargs_list:
-            try:
-                date = parser.parse(match, **kwargs)
-            except (ValueError, TypeError):  # pragma: no cover
-                # see https://bugs.launchpad.net/dateutil/+bug/1247643
-                date = None
-
-            # check date plausibility
-            if date and valid_year(date.year):  # pylint:disable=no-member
-                return start, end, date.date()  # pylint:disable=no-member
+        for day_first_opt in dayfirst_opts:
+            for year_first_opt in yearfirst_opts:
+                date = _parse_date(groups, year_first_opt, day_first_opt)
+
+                # check date plausibility
+                if date and valid_year(date.year):
+                    return start, end, date
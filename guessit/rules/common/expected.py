@@ -3,11 +3,100 @@
 """
 Expected property factory
 """
-from rebulk import Rebulk
+from operator import itemgetter
+
 from rebulk.remodule import re
 from rebulk.utils import find_all
 
 from . import dash, seps
+from .keywords import KeywordAutomaton
+
+_seps_table = str.maketrans(seps, ' ' * len(seps))
+
+# Prepared searches of the expected values given to the latest calls, by expected values.
+_prepared = {}
+_prepared_maxsize = 256
+
+# Minimum number of plain values to search them all at once with a keywords automaton.
+_indexed_min_size = 8
+
+
+class ExpectedSearches:
+    """
+    Searches of expected values, prepared once for all input strings.
+
+    Regular expressions (`re:` prefixed values) are compiled, and other values are normalized so that all separators
+    are spaces. As the input string is normalized before searching the first of those other values, regular
+    expressions following it are searched in the normalized input string.
+
+    When there are many plain values, like a catalogue of known titles, they are indexed in a keywords automaton
+    finding all of them in a single pass over the input string.
+    """
+
+    def __init__(self, values):
+        """
+        :param values: expected values
+        :type values: tuple
+        """
+        self.regexes = []
+        self.plains = {}
+        normalized = False
+        for index, value in enumerate(values):
+            if value.startswith('re:'):
+                pattern = value[3:].replace(' ', '-')
+                if pattern:
+                    pattern = pattern.replace(*dash)
+                self.regexes.append((index, normalized, re.compile(pattern, re.IGNORECASE)))
+            elif value:
+                normalized = True
+                search = value.translate(_seps_table)
+                self.plains.setdefault(search.lower(), []).append((index, len(search)))
+        self.automaton = KeywordAutomaton(self.plains) if len(self.plains) >= _indexed_min_size else None
+
+    def _occurrences(self, normalized_string):
+        if self.automaton:
+            return self.automaton.find(normalized_string).items()
+        lower_string = normalized_string.lower()
+        return ((search, find_all(lower_string, search)) for search in self.plains)
+
+    def find(self, input_string):
+        """
+        Find expected values in input string.
+        :param input_string:
+        :type input_string: str
+        :return: spans of regular expressions matches and dicts of plain values matches, in expected values order.
+        :rtype: list
+        """
+        found = []
+        normalized_string = input_string.translate(_seps_table)
+        for index, normalized, regex in self.regexes:
+            for match in regex.finditer(normalized_string if normalized else input_string):
+                if match.end() > match.start():
+                    found.append((index, match.span()))
+        if self.plains:
+            for search, starts in self._occurrences(normalized_string):
+                for start in starts:
+                    for index, length in self.plains[search]:
+                        found.append((index, {'start': start, 'end': start + length,
+                                              'value': normalized_string[start:start + length]}))
+        found.sort(key=itemgetter(0))
+        return [match for _, match in found]
+
+
+def prepare_expected(values):
+    """
+    Get searches of expected values, preparing them on first use.
+    :param values: expected values
+    :type values: tuple
+    :return:
+    :rtype: ExpectedSearches
+    """
+    prepared = _prepared.get(values)
+    if prepared is None:
+        if len(_prepared) >= _prepared_maxsize:
+            _prepared.clear()
+        prepared = _prepared[values] = ExpectedSearches(values)
+    return prepared
 
 
 def build_expected_function(context_key):
@@ -31,23 +120,6 @@ def build_expected_function(context_key):
         :return:
         :rtype:
         """
-        ret = []
-        for search in context.get(context_key):
-            if search.startswith('re:'):
-                search = search[3:]
-                search = search.replace(' ', '-')
-                matches = Rebulk().regex(search, abbreviations=[dash], flags=re.IGNORECASE) \
-                    .matches(input_string, context)
-                for match in matches:
-                    ret.append(match.span)
-            else:
-                for sep in seps:
-                    input_string = input_string.replace(sep, ' ')
-                    search = search.replace(sep, ' ')
-                for start in find_all(input_string, search, ignore_case=True):
-                    end = start + len(search)
-                    value = input_string[start:end]
-                    ret.append({'start': start, 'end': end, 'value': value})
-        return ret
+        return prepare_expected(tuple(context.get(context_key))).find(input_string)
 
     return expected
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Keywords automaton, finding all case-insensitive string patterns of a ruleset in a single pass.
+"""
+from collections import deque
+
+from rebulk import Rebulk
+from rebulk.match import Match
+from rebulk.pattern import StringPattern
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton, finding all occurrences of many keywords in a single pass over a string.
+
+    Keywords are searched in the lowercase string. Results of the last searched string are kept, as all patterns using
+    the automaton search the same input string one after the other.
+    """
+
+    def __init__(self, keywords):
+        """
+        :param keywords: lowercase keywords
+        :type keywords: iterable[str]
+        """
+        self.keywords = frozenset(keyword for keyword in keywords if keyword)
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        for keyword in self.keywords:
+            self._add(keyword)
+        self._link()
+        self._last = (None, None)
+
+    def _add(self, keyword):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = (keyword,)
+
+    def _link(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def find(self, string):
+        """
+        Find keywords in the lowercase string.
+
+        As with `str.find`, occurrences of a keyword are searched from left to right, and don't overlap each other.
+        :param string:
+        :type string: str
+        :return: start indices of each keyword found
+        :rtype: dict
+
+        >>> sorted(KeywordAutomaton(['dts', 'dts-hd', 'hd', 'aaa']).find('DTS-HD.AAAAAA.HD').items())
+        [('aaa', [7, 10]), ('dts', [0]), ('dts-hd', [0]), ('hd', [4, 14])]
+        """
+        last_string, found = self._last
+        if last_string is not None and last_string == string:
+            return found
+
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        found = {}
+        state = 0
+        for index, char in enumerate(string.lower()):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword in output[state]:
+                start = index - len(keyword) + 1
+                starts = found.get(keyword)
+                if starts is None:
+                    found[keyword] = [start]
+                elif starts[-1] + len(keyword) <= start:
+                    starts.append(start)
+
+        self._last = (string, found)
+        return found
+
+
+class KeywordPattern(StringPattern):
+    """
+    Case-insensitive string pattern, looking up occurrences found by the keywords automaton of its ruleset instead of
+    searching the input string for each of its strings.
+
+    It's built from a string pattern built by rebulk, so that it gets all its options and defaults. Until an automaton
+    is given, strings are searched as with a string pattern.
+    """
+
+    def __init__(self, string_pattern):  # pylint:disable=super-init-not-called
+        """
+        :param string_pattern: case-insensitive string pattern built by rebulk
+        :type string_pattern: StringPattern
+        """
+        vars(self).update(vars(string_pattern))
+        self.automaton = None
+
+    def _match(self, pattern, input_string, context=None):
+        if self.automaton is None:
+            yield from super()._match(pattern, input_string, context)
+            return
+        for index in self.automaton.find(input_string).get(pattern.lower(), ()):
+            match = Match(index, index + len(pattern), pattern=self, input_string=input_string, **self.match_options)
+            if match:
+                yield match
+
+
+class KeywordRebulk(Rebulk):
+    """
+    Rebulk building its case-insensitive string patterns as keyword patterns.
+
+    Patterns given a start or an end index are still built as string patterns.
+    """
+
+    def build_string(self, *pattern, **kwargs):
+        string_pattern = super().build_string(*pattern, **kwargs)
+        if string_pattern.match_options.get('ignore_case') and 'start' not in kwargs and 'end' not in kwargs:
+            return KeywordPattern(string_pattern)
+        return string_pattern
+
+
+def use_keyword_automaton(patterns):
+    """
+    Make keyword patterns find their strings with a single keywords automaton.
+    :param patterns:
+    :type patterns: list[Pattern]
+    :return: the automaton, or None if there's no keyword pattern.
+    :rtype: KeywordAutomaton
+    """
+    keyword_patterns = [pattern for pattern in patterns if isinstance(pattern, KeywordPattern)]
+    if not keyword_patterns:
+        return None
+
+    automaton = KeywordAutomaton(string.lower() for pattern in keyword_patterns for string in pattern.patterns)
+    for pattern in keyword_patterns:
+        pattern.automaton = automaton
+    return automaton
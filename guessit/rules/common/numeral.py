@@ -3,6 +3,8 @@
 """
 parse numeral from various formats
 """
+import itertools
+
 from rebulk.remodule import re
 
 digital_numeral = r'\d{1,4}'
@@ -27,86 +29,93 @@ french_alt_word_numeral_list = [
 
 def __build_word_numeral(*args):
     """
-    Build word numeral regexp from list.
+    Build word numeral regexp from lists, as a trie of words.
+
+    Alternatives of a regexp are tried in order, so words starting with a previous word (like `sixteen` after `six`)
+    can never be matched and are left out. Remaining words are factored by their common prefixes, so that each
+    character of the input is matched once, without backtracking.
 
     :param args:
     :type args:
-    :param kwargs:
-    :type kwargs:
     :return:
     :rtype:
     """
-    re_ = None
+    trie = {}
     for word_list in args:
         for word in word_list:
-            if not re_:
-                re_ = r'(?:(?=\w+)'
+            node = trie
+            for char in word:
+                if '' in node:
+                    break
+                node = node.setdefault(char, {})
             else:
-                re_ += '|'
-            re_ += word
-    re_ += ')'
-    return re_
+                node.setdefault('', {})
+    return __trie_pattern(trie)
+
+
+def __trie_pattern(node):
+    """
+    Build regexp of a trie node, keeping alternatives in the order of words.
+
+    :param node:
+    :type node: dict
+    :return:
+    :rtype: str
+    """
+    alternatives = [char + __trie_pattern(child) for char, child in node.items()]
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return '(?:' + '|'.join(alternatives) + ')' if alternatives else ''
 
 
 word_numeral = __build_word_numeral(english_word_numeral_list, french_word_numeral_list, french_alt_word_numeral_list)
 
 numeral = '(?:' + digital_numeral + '|' + roman_numeral + '|' + word_numeral + ')'
 
-__romanNumeralMap = (
-    ('M', 1000),
-    ('CM', 900),
-    ('D', 500),
-    ('CD', 400),
-    ('C', 100),
-    ('XC', 90),
-    ('L', 50),
-    ('XL', 40),
-    ('X', 10),
-    ('IX', 9),
-    ('V', 5),
-    ('IV', 4),
-    ('I', 1)
+__roman_digits = (
+    ('', 'M', 'MM', 'MMM', 'MMMM'),
+    ('', 'C', 'CC', 'CCC', 'CD', 'D', 'DC', 'DCC', 'DCCC', 'CM'),
+    ('', 'X', 'XX', 'XXX', 'XL', 'L', 'LX', 'LXX', 'LXXX', 'XC'),
+    ('', 'I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX')
 )
 
-__romanNumeralPattern = re.compile('^' + roman_numeral + '$')
 
-
-def __parse_roman(value):
+def __build_roman_numerals():
     """
-    convert Roman numeral to integer
+    Build the table of all valid Roman numerals, from I to MMMMCMXCIX.
 
-    :param value: Value to parse
-    :type value: string
     :return:
-    :rtype:
+    :rtype: dict
     """
-    if not __romanNumeralPattern.search(value):
-        raise ValueError(f'Invalid Roman numeral: {value}')
-
-    result = 0
-    index = 0
-    for num, integer in __romanNumeralMap:
-        while value[index:index + len(num)] == num:
-            result += integer
-            index += len(num)
-    return result
+    numerals = {}
+    for thousands, hundreds, tens, units in itertools.product(*(range(len(digits)) for digits in __roman_digits)):
+        key = __roman_digits[0][thousands] + __roman_digits[1][hundreds] + \
+              __roman_digits[2][tens] + __roman_digits[3][units]
+        if key:
+            numerals[key] = thousands * 1000 + hundreds * 100 + tens * 10 + units
+    return numerals
 
 
-def __parse_word(value):
+def __build_word_numerals(*args):
     """
-    Convert Word numeral to integer
+    Build the table of lowercase word numerals, the first list giving the value of words found in many lists.
 
-    :param value: Value to parse
-    :type value: string
+    :param args:
+    :type args:
     :return:
-    :rtype:
+    :rtype: dict
     """
-    for word_list in [english_word_numeral_list, french_word_numeral_list, french_alt_word_numeral_list]:
-        try:
-            return word_list.index(value.lower())
-        except ValueError:
-            pass
-    raise ValueError  # pragma: no cover
+    numerals = {}
+    for word_list in args:
+        for value, word in enumerate(word_list):
+            numerals.setdefault(word, value)
+    return numerals
+
+
+__roman_numerals = __build_roman_numerals()
+
+__word_numerals = __build_word_numerals(english_word_numeral_list, french_word_numeral_list,
+                                        french_alt_word_numeral_list)
 
 
 _clean_re = re.compile(r'[^\d]*(\d+)[^\d]*')
@@ -129,37 +138,32 @@ def parse_numeral(value, int_enabled=True, roman_enabled=True, word_enabled=True
     :return: Numeric value, or None if value can't be parsed
     :rtype: int
     """
-    # pylint: disable=too-many-branches
+    # pylint: disable=too-many-branches,too-many-return-statements
     if int_enabled:
-        try:
-            if clean:
-                match = _clean_re.match(value)
-                if match:
-                    clean_value = match.group(1)
-                    return int(clean_value)
+        if value.isdecimal():
             return int(value)
-        except ValueError:
-            pass
+        if clean:
+            match = _clean_re.match(value)
+            if match:
+                return int(match.group(1))
+        else:
+            try:
+                return int(value)
+            except ValueError:
+                pass
+    words = value.split() if clean else ()
     if roman_enabled:
-        try:
-            if clean:
-                for word in value.split():
-                    try:
-                        return __parse_roman(word.upper())
-                    except ValueError:
-                        pass
-            return __parse_roman(value)
-        except ValueError:
-            pass
+        for word in words:
+            parsed = __roman_numerals.get(word.upper())
+            if parsed is not None:
+                return parsed
+        if value in __roman_numerals:
+            return __roman_numerals[value]
     if word_enabled:
-        try:
-            if clean:
-                for word in value.split():
-                    try:
-                        return __parse_word(word)
-                    except ValueError:  # pragma: no cover
-                        pass
-            return __parse_word(value)  # pragma: no cover
-        except ValueError:  # pragma: no cover
-            pass
+        for word in words:
+            parsed = __word_numerals.get(word.lower())
+            if parsed is not None:
+                return parsed
+        if value.lower() in __word_numerals:  # pragma: no cover
+            return __word_numerals[value.lower()]
     raise ValueError('Invalid numeral: ' + value)   # pragma: no cover
@@ -32,3 +32,68 @@ def iter_words(string):
         i += 1
     if inside_word:
         yield _Word(span=(last_sep_index+1, i), value=string[last_sep_index+1:i])
+
+
+class InputAnalysis:
+    """
+    Analysis of an input string shared by all properties modules, so that they don't scan the string again.
+
+    The api puts it in the context under the `input_analysis` key. Each part is computed on first access.
+    """
+
+    def __init__(self, string):
+        self.string = string
+        self._lower = None
+        self._words = None
+        self._lower_words = None
+
+    @property
+    def lower(self):
+        """
+        Lowercase input string.
+        """
+        if self._lower is None:
+            self._lower = self.string.lower()
+        return self._lower
+
+    @property
+    def words(self):
+        """
+        Words of the input string.
+        """
+        if self._words is None:
+            self._words = tuple(iter_words(self.string))
+        return self._words
+
+    @property
+    def lower_words(self):
+        """
+        Words of the lowercase input string.
+
+        They are lowercased from words of the input string, that have the same spans unless lowercasing changes the
+        string length.
+        """
+        if self._lower_words is None:
+            lower = self.lower
+            if len(lower) == len(self.string):
+                self._lower_words = tuple(_Word(span=word.span, value=lower[word.span[0]:word.span[1]])
+                                          for word in self.words)
+            else:
+                self._lower_words = tuple(iter_words(lower))
+        return self._lower_words
+
+
+def input_analysis(string, context=None):
+    """
+    Get the analysis of string from context, or a new one if context has no analysis for this string.
+    :param string:
+    :type string: str
+    :param context:
+    :type context: dict
+    :return:
+    :rtype: InputAnalysis
+    """
+    analysis = context.get('input_analysis') if context else None
+    if analysis is None or analysis.string != string:
+        analysis = InputAnalysis(string)
+    return analysis
@@ -58,28 +58,43 @@ class EquivalentHoles(Rule):
     priority = POST_PROCESS
     consequence = AppendMatch
 
+    @staticmethod
+    def _equivalents_index(matches):
+        """
+        Index string matches by lowercase value, then by name in matches names order.
+        """
+        index = defaultdict(dict)
+        for name in matches.names:
+            for current_match in matches.named(name):
+                if isinstance(current_match.value, str) and 'equivalent-ignore' not in current_match.tags:
+                    index[current_match.value.lower()].setdefault(name, []).append(current_match)
+        return index
+
     def when(self, matches, context):
         new_matches = []
+        index = self._equivalents_index(matches)
+        names_order = {name: i for i, name in enumerate(matches.names)}
 
         for filepath in marker_sorted(matches.markers.named('path'), matches):
-            holes = matches.holes(start=filepath.start, end=filepath.end, formatter=cleanup)
-            for name in matches.names:
-                for hole in list(holes):
-                    for current_match in matches.named(name):
-                        if isinstance(current_match.value, str) and \
-                                        hole.value.lower() == current_match.value.lower():
-                            if 'equivalent-ignore' in current_match.tags:
-                                continue
-                            new_value = _preferred_string(hole.value, current_match.value)
-                            if hole.value != new_value:
-                                hole.value = new_value
-                            if current_match.value != new_value:
-                                current_match.value = new_value
-                            hole.name = name
-                            hole.tags = ['equivalent']
-                            new_matches.append(hole)
-                            if hole in holes:
-                                holes.remove(hole)
+            equivalent_holes = []
+            for hole in matches.holes(start=filepath.start, end=filepath.end, formatter=cleanup):
+                by_name = index.get(hole.value.lower())
+                if by_name:
+                    # Hole is equivalent to matches having the first name, in matches names order.
+                    name, equivalents = next(iter(by_name.items()))
+                    equivalent_holes.append((names_order[name], len(equivalent_holes), name, hole, equivalents))
+            equivalent_holes.sort(key=lambda item: item[:2])
+
+            for _, _, name, hole, equivalents in equivalent_holes:
+                for current_match in equivalents:
+                    new_value = _preferred_string(hole.value, current_match.value)
+                    if hole.value != new_value:
+                        hole.value = new_value
+                    if current_match.value != new_value:
+                        current_match.value = new_value
+                    hole.name = name
+                    hole.tags = ['equivalent']
+                    new_matches.append(hole)
 
         return new_matches
 
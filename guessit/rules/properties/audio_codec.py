@@ -3,12 +3,13 @@
 """
 audio_codec, audio_profile and audio_channels property
 """
-from rebulk import Rebulk, Rule, RemoveMatch
+from rebulk import Rule, RemoveMatch
 from rebulk.remodule import re
 
 from ..common import dash
 from ..common.pattern import is_disabled
 from ..common.validators import seps_before, seps_after
+from ..common.keywords import KeywordRebulk
 from ...config import load_config_patterns
 
 audio_properties = ['audio_codec', 'audio_profile', 'audio_channels']
@@ -23,7 +24,7 @@ def audio_codec(config):  # pylint:disable=unused-argument
     :return: Created Rebulk object
     :rtype: Rebulk
     """
-    rebulk = Rebulk() \
+    rebulk = KeywordRebulk() \
         .regex_defaults(flags=re.IGNORECASE, abbreviations=[dash]) \
         .string_defaults(ignore_case=True)
 
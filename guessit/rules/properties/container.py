@@ -5,11 +5,10 @@ container property
 """
 from rebulk.remodule import re
 
-from rebulk import Rebulk
-
 from ..common import seps
 from ..common.pattern import is_disabled
 from ..common.validators import seps_surround
+from ..common.keywords import KeywordRebulk
 from ...reutils import build_or_pattern
 
 
@@ -22,7 +21,7 @@ def container(config):
     :return: Created Rebulk object
     :rtype: Rebulk
     """
-    rebulk = Rebulk(disabled=lambda context: is_disabled(context, 'container'))
+    rebulk = KeywordRebulk(disabled=lambda context: is_disabled(context, 'container'))
     rebulk = rebulk.regex_defaults(flags=re.IGNORECASE).string_defaults(ignore_case=True)
     rebulk.defaults(name='container',
                     formatter=lambda value: value.strip(seps),
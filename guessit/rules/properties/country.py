@@ -8,7 +8,10 @@ import babelfish
 
 from rebulk import Rebulk
 from ..common.pattern import is_disabled
-from ..common.words import iter_words
+from ..common.words import input_analysis, iter_words
+
+# Maximum number of country finders kept by rules, one for each allowed countries set.
+_finders_maxsize = 64
 
 
 def country(config, common_words):
@@ -25,12 +28,20 @@ def country(config, common_words):
     rebulk = Rebulk(disabled=lambda context: is_disabled(context, 'country'))
     rebulk = rebulk.defaults(name='country')
 
+    converter = GuessitCountryConverter(config['synonyms'])
+    finders = {}
+
     def find_countries(string, context=None):
         """
         Find countries in given string.
         """
-        allowed_countries = context.get('allowed_countries') if context else None
-        return CountryFinder(allowed_countries, common_words).find(string)
+        allowed_countries = frozenset(context.get('allowed_countries') or []) if context else frozenset()
+        finder = finders.get(allowed_countries)
+        if finder is None:
+            if len(finders) >= _finders_maxsize:
+                finders.clear()
+            finder = finders[allowed_countries] = CountryFinder(allowed_countries, common_words, converter)
+        return finder.find(string, context)
 
     rebulk.functional(find_countries,
                       #  Prefer language and any other property over country if not US or GB.
@@ -41,7 +52,7 @@ def country(config, common_words):
                       properties={'country': [None]},
                       disabled=lambda context: not context.get('allowed_countries'))
 
-    babelfish.country_converters['guessit'] = GuessitCountryConverter(config['synonyms'])
+    babelfish.country_converters['guessit'] = converter
 
     return rebulk
 
@@ -54,11 +65,22 @@ class GuessitCountryConverter(babelfish.CountryReverseConverter):  # pylint: dis
             for syn in synlist:
                 self.guessit_exceptions[syn.lower()] = alpha2
 
+        self._codes = (babelfish.country_converters['name'].codes |
+                       frozenset(babelfish.COUNTRIES.values()) |
+                       frozenset(self.guessit_exceptions.keys()))
+
+        # Lowercase synonym, alpha2 code or name to alpha2 code.
+        # exceptions come first, as they need to override a potential match
+        # with any of the other guessers
+        self.lexicon = dict(self.guessit_exceptions)
+        for alpha2 in babelfish.COUNTRIES:
+            self.lexicon.setdefault(alpha2.lower(), alpha2)
+        for name, alpha2 in babelfish.country_converters['name'].from_name.items():
+            self.lexicon.setdefault(name.lower(), alpha2)
+
     @property
     def codes(self):  # pylint: disable=missing-docstring
-        return (babelfish.country_converters['name'].codes |
-                frozenset(babelfish.COUNTRIES.values()) |
-                frozenset(self.guessit_exceptions.keys()))
+        return self._codes
 
     def convert(self, alpha2):
         if alpha2 == 'GB':
@@ -66,48 +88,45 @@ class GuessitCountryConverter(babelfish.CountryReverseConverter):  # pylint: dis
         return str(babelfish.Country(alpha2))
 
     def reverse(self, name):  # pylint:disable=arguments-renamed
-        # exceptions come first, as they need to override a potential match
-        # with any of the other guessers
         try:
-            return self.guessit_exceptions[name.lower()]
+            return self.lexicon[name.lower()]
         except KeyError:
-            pass
-
-        try:
-            return babelfish.Country(name.upper()).alpha2
-        except ValueError:
-            pass
-
-        for conv in [babelfish.Country.fromname]:
-            try:
-                return conv(name).alpha2
-            except babelfish.CountryReverseError:
-                pass
-
-        raise babelfish.CountryReverseError(name)
+            raise babelfish.CountryReverseError(name) from None
 
 
 class CountryFinder:
     """Helper class to search and return country matches."""
 
-    def __init__(self, allowed_countries, common_words):
-        self.allowed_countries = {l.lower() for l in allowed_countries or []}
-        self.common_words = common_words
-
-    def find(self, string):
-        """Return all matches for country."""
-        for word_match in iter_words(string.strip().lower()):
-            word = word_match.value
-            if word.lower() in self.common_words:
+    def __init__(self, allowed_countries, common_words, converter=None):
+        """
+        :param allowed_countries: names or alpha2 codes of countries to find
+        :type allowed_countries: list
+        :param common_words: words that are never countries
+        :type common_words: set
+        :param converter: guessit country converter, the registered one if not given.
+        :type converter: GuessitCountryConverter
+        """
+        if converter is None:
+            converter = babelfish.country_converters['guessit']
+        allowed_countries = {l.lower() for l in allowed_countries or []}
+
+        # Lowercase word to allowed country, so that each word is looked up once.
+        self.countries = {}
+        for word, alpha2 in converter.lexicon.items():
+            if word in common_words:
                 continue
+            country_object = babelfish.Country(alpha2)
+            if country_object.name.lower() in allowed_countries or alpha2.lower() in allowed_countries:
+                self.countries[word] = country_object
 
-            try:
-                country_object = babelfish.Country.fromguessit(word)
-                if (country_object.name.lower() in self.allowed_countries or
-                        country_object.alpha2.lower() in self.allowed_countries):
-                    yield self._to_rebulk_match(word_match, country_object)
-            except babelfish.Error:
-                continue
+    def find(self, string, context=None):
+        """Return all matches for country."""
+        stripped = string.strip()
+        words = input_analysis(string, context).lower_words if stripped == string else iter_words(stripped.lower())
+        for word_match in words:
+            country_object = self.countries.get(word_match.value)
+            if country_object is not None:
+                yield self._to_rebulk_match(word_match, country_object)
 
     @classmethod
     def _to_rebulk_match(cls, word, value):
@@ -3,6 +3,8 @@
 """
 crc and uuid properties
 """
+from string import ascii_letters, digits
+
 from rebulk.remodule import re
 
 from rebulk import Rebulk
@@ -35,12 +37,26 @@ def crc(config):  # pylint:disable=unused-argument
     return rebulk
 
 
-_digit = 0
-_letter = 1
-_other = 2
-
 _idnum = re.compile(r'(?P<uuid>[a-zA-Z0-9-]{20,})')  # 1.0, (0, 0))
 
+# Characters of id numbers are classified as digit (0), letter (1) or other (2).
+_classes_table = bytes.maketrans((digits + ascii_letters + '-').encode('ascii'), b'0' * 10 + b'1' * 52 + b'2')
+_non_letters = (digits + '-').encode('ascii')
+
+
+def _changes(data):
+    """
+    Count bytes that differ from the previous one, the first byte being always counted.
+
+    Bytes are compared all at once, by xoring them with the same bytes shifted by one.
+    :param data:
+    :type data: bytes
+    :return:
+    :rtype: int
+    """
+    value = int.from_bytes(data, 'big')
+    return len(data) - (value ^ (value >> 8)).to_bytes(len(data), 'big').count(0)
+
 
 def guess_idnumber(string):
     """
@@ -50,41 +66,27 @@ def guess_idnumber(string):
     :return:
     :rtype:
     """
-    # pylint:disable=invalid-name
     ret = []
 
-    matches = list(_idnum.finditer(string))
-    for match in matches:
-        result = match.groupdict()
-        switch_count = 0
-        switch_letter_count = 0
-        letter_count = 0
-        last_letter = None
-
-        last = _letter
-        for c in result['uuid']:
-            if c in '0123456789':
-                ci = _digit
-            elif c in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ':
-                ci = _letter
-                if c != last_letter:
-                    switch_letter_count += 1
-                last_letter = c
-                letter_count += 1
-            else:
-                ci = _other
-
-            if ci != last:
-                switch_count += 1
-
-            last = ci
+    for match in _idnum.finditer(string):
+        idnum = match.group('uuid').encode('ascii')
 
         # only return the result as probable if we alternate often between
         # char type (more likely for hash values than for common words)
-        switch_ratio = float(switch_count) / len(result['uuid'])
-        letters_ratio = (float(switch_letter_count) / letter_count) if letter_count > 0 else 1
+        letters = idnum.translate(None, _non_letters)
+        # Each digit or other char can start at most two char type runs.
+        if float(2 * (len(idnum) - len(letters)) + 1) / len(idnum) <= 0.4:
+            continue
+
+        letters_ratio = (float(_changes(letters)) / len(letters)) if letters else 1
+        if letters_ratio <= 0.4:
+            continue
+
+        # First char type is compared to a letter.
+        switch_count = _changes(b'1' + idnum.translate(_classes_table)) - 1
+        switch_ratio = float(switch_count) / len(idnum)
 
-        if switch_ratio > 0.4 and letters_ratio > 0.4:
+        if switch_ratio > 0.4:
             ret.append(match.span())
 
     return ret
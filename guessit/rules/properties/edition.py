@@ -3,12 +3,12 @@
 """
 edition property
 """
-from rebulk import Rebulk
 from rebulk.remodule import re
 
 from ..common import dash
 from ..common.pattern import is_disabled
 from ..common.validators import seps_surround
+from ..common.keywords import KeywordRebulk
 from ...config import load_config_patterns
 
 
@@ -21,7 +21,7 @@ def edition(config):  # pylint:disable=unused-argument
     :return: Created Rebulk object
     :rtype: Rebulk
     """
-    rebulk = Rebulk(disabled=lambda context: is_disabled(context, 'edition'))
+    rebulk = KeywordRebulk(disabled=lambda context: is_disabled(context, 'edition'))
     rebulk.regex_defaults(flags=re.IGNORECASE, abbreviations=[dash]).string_defaults(ignore_case=True)
     rebulk.defaults(name='edition', validator=seps_surround)
 
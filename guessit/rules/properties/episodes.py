@@ -6,7 +6,7 @@ episode, season, disc, episode_count, season_count and episode_details propertie
 import copy
 from collections import defaultdict
 
-from rebulk import Rebulk, RemoveMatch, Rule, AppendMatch, RenameMatch
+from rebulk import RemoveMatch, Rule, AppendMatch, RenameMatch
 from rebulk.match import Match
 from rebulk.remodule import re
 from rebulk.utils import is_iterable
@@ -18,6 +18,7 @@ from ..common import dash, alt_dash, seps, seps_no_fs
 from ..common.formatters import strip
 from ..common.pattern import is_disabled
 from ..common.validators import seps_surround, int_coercable, and_
+from ..common.keywords import KeywordRebulk
 from ...reutils import build_or_pattern
 
 
@@ -153,7 +154,7 @@ def episodes(config):
     season_max_range = config['season_max_range']
     max_range_gap = config['max_range_gap']
 
-    rebulk = Rebulk() \
+    rebulk = KeywordRebulk() \
         .regex_defaults(flags=re.IGNORECASE) \
         .string_defaults(ignore_case=True) \
         .chain_defaults(chain_breaker=episodes_season_chain_breaker) \
@@ -8,13 +8,22 @@ import copy
 from collections import defaultdict, namedtuple
 
 import babelfish
-from rebulk import Rebulk, Rule, RemoveMatch, RenameMatch
+from rebulk import Rule, RemoveMatch, RenameMatch
 from rebulk.remodule import re
 
 from ..common import seps
 from ..common.pattern import is_disabled
 from ..common.validators import seps_surround
-from ..common.words import iter_words
+from ..common.words import input_analysis
+from ..common.keywords import KeywordRebulk
+
+# Maximum number of language finders kept by rules, one for each allowed languages set.
+_finders_maxsize = 64
+
+# Lexicons of language names built by converters, by synonyms. Babelfish names don't change, so they are shared by all
+# rules built with the same synonyms.
+_lexicons = {}
+_lexicons_maxsize = 16
 
 
 def language(config, common_words):
@@ -36,8 +45,8 @@ def language(config, common_words):
     lang_suffixes = sorted(lang_both + config['language_suffixes'], key=length_comparator)
     weak_affixes = frozenset(config['weak_affixes'])
 
-    rebulk = Rebulk(disabled=lambda context: (is_disabled(context, 'language') and
-                                              is_disabled(context, 'subtitle_language')))
+    rebulk = KeywordRebulk(disabled=lambda context: (is_disabled(context, 'language') and
+                                                     is_disabled(context, 'subtitle_language')))
 
     rebulk.string(*subtitle_prefixes, name="subtitle_language.prefix", ignore_case=True, private=True,
                   validator=seps_surround, tags=['release-group-prefix'],
@@ -49,13 +58,22 @@ def language(config, common_words):
                   validator=seps_surround, tags=['source-suffix'],
                   disabled=lambda context: is_disabled(context, 'language'))
 
+    finders = {}
+
     def find_languages(string, context=None):
         """Find languages in the string
 
         :return: list of tuple (property, Language, lang_word, word)
         """
-        return LanguageFinder(context, subtitle_prefixes, subtitle_suffixes,
-                              lang_prefixes, lang_suffixes, weak_affixes).find(string)
+        allowed_languages = context.get('allowed_languages') if context else None
+        key = frozenset(allowed_languages or []), is_disabled(context, 'subtitle_language')
+        finder = finders.get(key)
+        if finder is None:
+            if len(finders) >= _finders_maxsize:
+                finders.clear()
+            finder = finders[key] = LanguageFinder(context, subtitle_prefixes, subtitle_suffixes,
+                                                   lang_prefixes, lang_suffixes, weak_affixes)
+        return finder.find(string, context)
 
     rebulk.functional(find_languages,
                       properties={'language': [None]},
@@ -81,6 +99,17 @@ class GuessitConverter(babelfish.LanguageReverseConverter):  # pylint: disable=m
     _with_country_regexp = re.compile(r'(.*)\((.*)\)')
     _with_country_regexp2 = re.compile(r'(.*)-(.*)')
 
+    # Babelfish constructors tried in turn to reverse a name, when it's not a guessit synonym.
+    _reverse_converters = (babelfish.Language,
+                           babelfish.Language.fromalpha3b,
+                           babelfish.Language.fromalpha2,
+                           babelfish.Language.fromname,
+                           babelfish.Language.fromopensubtitles,
+                           babelfish.Language.fromietf)
+
+    # Maximum number of names reversed on demand to keep, in addition to the lexicon.
+    _reversed_maxsize = 10000
+
     def __init__(self, synonyms):
         self.guessit_exceptions = {}
         for code, synlist in synonyms.items():
@@ -91,20 +120,59 @@ class GuessitConverter(babelfish.LanguageReverseConverter):  # pylint: disable=m
             for syn in synlist:
                 self.guessit_exceptions[syn.lower()] = (alpha3, country, None)
 
+        self._codes = (babelfish.language_converters['alpha3b'].codes |
+                       babelfish.language_converters['alpha2'].codes |
+                       babelfish.language_converters['name'].codes |
+                       babelfish.language_converters['opensubtitles'].codes |
+                       babelfish.country_converters['name'].codes |
+                       frozenset(self.guessit_exceptions.keys()))
+
+        key = tuple(sorted((code, tuple(synlist)) for code, synlist in synonyms.items()))
+        self._lexicon = _lexicons.get(key)
+        if self._lexicon is None:
+            if len(_lexicons) >= _lexicons_maxsize:
+                _lexicons.clear()
+            self._lexicon = _lexicons[key] = self._build_lexicon()
+        self._reversed = {}
+
+    def _build_lexicon(self):
+        """
+        Build the lowercase name to (alpha3, country, script) dict of names known by guessit and babelfish.
+
+        Entries are added in the order of `_reverse_converters`, so that each name is reversed as `_reverse` would do.
+        Babelfish IETF codes other than plain alpha3 and alpha2 codes are not part of it.
+        """
+        converters = babelfish.language_converters
+        lexicon = dict(self.guessit_exceptions)
+
+        for alpha3 in babelfish.LANGUAGES:
+            lexicon.setdefault(alpha3, (alpha3, None, None))
+        # alpha3b and alpha2 converters are case-sensitive, so only their lowercase codes match a lowercase name.
+        for converter in (converters['alpha3b'], converters['alpha2']):
+            for code, reverse in converter.from_symbol.items():
+                if code == code.lower():
+                    lexicon.setdefault(code, reverse)
+        for code, reverse in converters['name'].from_symbol.items():
+            lexicon.setdefault(code.lower(), reverse)
+        for code, reverse in converters['opensubtitles'].from_opensubtitles.items():
+            lang = babelfish.Language(*reverse)
+            lexicon.setdefault(code.lower(), (lang.alpha3, lang.country, lang.script))
+
+        return lexicon
+
     @property
     def codes(self):  # pylint: disable=missing-docstring
-        return (babelfish.language_converters['alpha3b'].codes |
-                babelfish.language_converters['alpha2'].codes |
-                babelfish.language_converters['name'].codes |
-                babelfish.language_converters['opensubtitles'].codes |
-                babelfish.country_converters['name'].codes |
-                frozenset(self.guessit_exceptions.keys()))
+        return self._codes
 
     def convert(self, alpha3, country=None, script=None):
         return str(babelfish.Language(alpha3, country, script))
 
-    def reverse(self, name):  # pylint:disable=arguments-renamed
-        name = name.lower()
+    def _reverse(self, name):
+        """
+        Reverse a lowercase name, trying guessit synonyms and then each babelfish converter.
+        :return: (alpha3, country, script) tuple, or None if name is not a language.
+        :rtype: tuple
+        """
         # exceptions come first, as they need to override a potential match
         # with any of the other guessers
         try:
@@ -112,19 +180,31 @@ class GuessitConverter(babelfish.LanguageReverseConverter):  # pylint: disable=m
         except KeyError:
             pass
 
-        for conv in [babelfish.Language,
-                     babelfish.Language.fromalpha3b,
-                     babelfish.Language.fromalpha2,
-                     babelfish.Language.fromname,
-                     babelfish.Language.fromopensubtitles,
-                     babelfish.Language.fromietf]:
+        for conv in self._reverse_converters:
             try:
                 reverse = conv(name)
                 return reverse.alpha3, reverse.country, reverse.script
             except (ValueError, babelfish.LanguageReverseError):
                 pass
 
-        raise babelfish.LanguageReverseError(name)
+        return None
+
+    def reverse(self, name):  # pylint:disable=arguments-renamed
+        name = name.lower()
+        try:
+            reverse = self._lexicon[name]
+        except KeyError:
+            # Other names, like IETF codes or unknown words, are reversed on demand. Misses are kept too.
+            try:
+                reverse = self._reversed[name]
+            except KeyError:
+                if len(self._reversed) >= self._reversed_maxsize:
+                    self._reversed.clear()
+                reverse = self._reversed[name] = self._reverse(name)
+
+        if reverse is None:
+            raise babelfish.LanguageReverseError(name)
+        return reverse
 
 
 def length_comparator(value):
@@ -134,6 +214,50 @@ def length_comparator(value):
     return len(value)
 
 
+def _affix_trie(affixes, reverse=False):
+    """
+    Build a trie of affixes, as nested dicts of characters. The None key of a node holds the affix ending there.
+
+    Suffixes are added reversed, but the node still holds the suffix itself.
+    """
+    trie = {}
+    for affix in affixes:
+        node = trie
+        for char in affix[::-1] if reverse else affix:
+            node = node.setdefault(char, {})
+        node[None] = affix
+    return trie
+
+
+def _iter_trie_affixes(trie, chars):
+    """
+    Yield affixes of the trie found along chars, shortest first.
+    """
+    node = trie
+    if None in node:
+        yield node[None]
+    for char in chars:
+        node = node.get(char)
+        if node is None:
+            return
+        if None in node:
+            yield node[None]
+
+
+def _iter_prefixes(trie, string):
+    """
+    Yield prefixes of the string found in the trie, shortest first.
+    """
+    return _iter_trie_affixes(trie, string)
+
+
+def _iter_suffixes(trie, string):
+    """
+    Yield suffixes of the string found in the trie of reversed suffixes, shortest first.
+    """
+    return _iter_trie_affixes(trie, reversed(string))
+
+
 _LanguageMatch = namedtuple('_LanguageMatch', ['property_name', 'word', 'lang'])
 
 
@@ -202,17 +326,19 @@ class LanguageFinder:
         allowed_languages = context.get('allowed_languages') if context else None
         self.allowed_languages = {l.lower() for l in allowed_languages or []}
         self.weak_affixes = weak_affixes
+        # Affixes are stored in tries, suffixes being reversed, so that finding the affixes of a word doesn't depend on
+        # the number of affixes.
         self.prefixes_map = {}
         self.suffixes_map = {}
 
         if not is_disabled(context, 'subtitle_language'):
-            self.prefixes_map['subtitle_language'] = subtitle_prefixes
-            self.suffixes_map['subtitle_language'] = subtitle_suffixes
+            self.prefixes_map['subtitle_language'] = _affix_trie(subtitle_prefixes)
+            self.suffixes_map['subtitle_language'] = _affix_trie(subtitle_suffixes, reverse=True)
 
-        self.prefixes_map['language'] = lang_prefixes
-        self.suffixes_map['language'] = lang_suffixes
+        self.prefixes_map['language'] = _affix_trie(lang_prefixes)
+        self.suffixes_map['language'] = _affix_trie(lang_suffixes, reverse=True)
 
-    def find(self, string):
+    def find(self, string, context=None):
         """
         Return all matches for language and subtitle_language.
 
@@ -223,7 +349,7 @@ class LanguageFinder:
         undetermined_map = defaultdict(set)
         multi_map = defaultdict(set)
 
-        for match in self.iter_language_matches(string):
+        for match in self.iter_language_matches(string, context):
             key = match.property_name
             if match.lang == UNDETERMINED:
                 undetermined_map[key].add(match)
@@ -246,13 +372,13 @@ class LanguageFinder:
             for value in values:
                 yield to_rebulk_match(value)
 
-    def iter_language_matches(self, string):
+    def iter_language_matches(self, string, context=None):
         """
         Return language matches for the given string.
         """
         candidates = []
         previous = None
-        for word in iter_words(string):
+        for word in input_analysis(string, context).words:
             language_word = LanguageWord(start=word.span[0], end=word.span[1], value=word.value, input_string=string)
             if previous:
                 previous.next_word = language_word
@@ -272,19 +398,19 @@ class LanguageFinder:
         tuples = [
             (language_word, language_word.next_word,
              self.prefixes_map,
-             lambda string, prefix: string.startswith(prefix),
+             _iter_prefixes,
              lambda string, prefix: string[len(prefix):]),
             (language_word.next_word, language_word,
              self.suffixes_map,
-             lambda string, suffix: string.endswith(suffix),
+             _iter_suffixes,
              lambda string, suffix: string[:len(string) - len(suffix)])
         ]
 
-        for word, fallback_word, affixes, is_affix, strip_affix in tuples:
+        for word, fallback_word, affixes, iter_affixes, strip_affix in tuples:
             if not word:
                 continue
 
-            match = self.find_match_for_word(word, fallback_word, affixes, is_affix, strip_affix)
+            match = self.find_match_for_word(word, fallback_word, affixes, iter_affixes, strip_affix)
             if match:
                 yield match
 
@@ -292,7 +418,7 @@ class LanguageFinder:
         if match:
             yield match
 
-    def find_match_for_word(self, word, fallback_word, affixes, is_affix, strip_affix):
+    def find_match_for_word(self, word, fallback_word, affixes, iter_affixes, strip_affix):
         """
         Return the language match for the given word and affixes.
         """
@@ -302,11 +428,8 @@ class LanguageFinder:
 
             word_lang = current_word.value.lower()
 
-            for key, parts in affixes.items():
-                for part in parts:
-                    if not is_affix(word_lang, part):
-                        continue
-
+            for key, trie in affixes.items():
+                for part in iter_affixes(trie, word_lang):
                     match = None
                     value = strip_affix(word_lang, part)
                     if not value:
@@ -7,26 +7,82 @@ import mimetypes
 
 from rebulk import Rebulk, CustomRule, POST_PROCESS
 from rebulk.match import Match
+from rebulk.remodule import re
 
 from ..common.pattern import is_disabled
 from ...rules.processors import Processors
 
 
-def mimetype(config):  # pylint:disable=unused-argument
+# Scheme of urls, as split by mimetypes.
+_scheme_re = re.compile('([^/:]+):(.*)', re.DOTALL)
+
+
+def mimetype(config, container_config=None):  # pylint:disable=unused-argument
     """
     Builder for rebulk object.
 
     :param config: rule configuration
     :type config: dict
+    :param container_config: container rule configuration, giving extensions with a precomputed mimetype
+    :type container_config: dict
     :return: Created Rebulk object
     :rtype: Rebulk
     """
     rebulk = Rebulk(disabled=lambda context: is_disabled(context, 'mimetype'))
-    rebulk.rules(Mimetype)
+    rebulk.rules(Mimetype(build_mimetypes_table(container_config or {})))
 
     return rebulk
 
 
+def build_mimetypes_table(container_config):
+    """
+    Build the lowercase extension to mimetype table of container extensions.
+
+    Extensions that mimetypes maps to another suffix or to an encoding, like `.tgz` or `.gz`, are left out.
+    :param container_config: container rule configuration
+    :type container_config: dict
+    :return:
+    :rtype: dict
+    """
+    encodings = {encoding.lower() for encoding in mimetypes.encodings_map}
+    table = {}
+    for extensions in container_config.values():
+        for extension in extensions:
+            extension = '.' + extension.lower()
+            if extension not in mimetypes.suffix_map and extension not in encodings:
+                table[extension] = mimetypes.guess_type('file' + extension, strict=False)[0]
+    return table
+
+
+def guess_mimetype(string, table):
+    """
+    Guess the mimetype of a filepath, as `mimetypes.guess_type` does.
+
+    Mimetype of extensions found in table is looked up there, others are guessed by mimetypes.
+    :param string: filepath
+    :type string: str
+    :param table: lowercase extension to mimetype table
+    :type table: dict
+    :return:
+    :rtype: str
+    """
+    path = string
+    if ':' in path:
+        scheme_match = _scheme_re.match(path)
+        if scheme_match:
+            if scheme_match.group(1).lower() == 'data':
+                return mimetypes.guess_type(string, strict=False)[0]
+            path = scheme_match.group(2)
+    # Extension is split as posixpath.splitext does, ignoring leading dots of the filename.
+    dot = path.rfind('.')
+    filename_start = path.rfind('/') + 1
+    if dot > filename_start and path[filename_start:dot].lstrip('.'):
+        extension = path[dot:].lower()
+        if extension in table:
+            return table[extension]
+    return mimetypes.guess_type(string, strict=False)[0]
+
+
 class Mimetype(CustomRule):
     """
     Mimetype post processor
@@ -39,9 +95,12 @@ class Mimetype(CustomRule):
 
     dependency = Processors
 
+    def __init__(self, table):
+        super().__init__()
+        self.table = table
+
     def when(self, matches, context):
-        mime, _ = mimetypes.guess_type(matches.input_string, strict=False)
-        return mime
+        return guess_mimetype(matches.input_string, self.table)
 
     def then(self, matches, when_response, context):
         mime = when_response
@@ -12,6 +12,7 @@ from ..common import dash
 from ..common import seps
 from ..common.pattern import is_disabled
 from ..common.validators import seps_after, seps_before, seps_surround, and_
+from ..common.keywords import KeywordRebulk
 from ...config import load_config_patterns
 from ...reutils import build_or_pattern
 from ...rules.common.formatters import raw_cleanup
@@ -26,7 +27,7 @@ def other(config):  # pylint:disable=unused-argument,too-many-statements
     :return: Created Rebulk object
     :rtype: Rebulk
     """
-    rebulk = Rebulk(disabled=lambda context: is_disabled(context, 'other'))
+    rebulk = KeywordRebulk(disabled=lambda context: is_disabled(context, 'other'))
     rebulk = rebulk.regex_defaults(flags=re.IGNORECASE, abbreviations=[dash]).string_defaults(ignore_case=True)
     rebulk.defaults(name="other", validator=seps_surround)
 
@@ -6,12 +6,13 @@ screen_size property
 from rebulk.match import Match
 from rebulk.remodule import re
 
-from rebulk import Rebulk, Rule, RemoveMatch, AppendMatch
+from rebulk import Rule, RemoveMatch, AppendMatch
 
 from ..common.pattern import is_disabled
 from ..common.quantity import FrameRate
 from ..common.validators import seps_surround
 from ..common import dash, seps
+from ..common.keywords import KeywordRebulk
 from ...reutils import build_or_pattern
 
 
@@ -30,7 +31,7 @@ def screen_size(config):
     min_ar = config['min_ar']
     max_ar = config['max_ar']
 
-    rebulk = Rebulk()
+    rebulk = KeywordRebulk()
     rebulk = rebulk.string_defaults(ignore_case=True).regex_defaults(flags=re.IGNORECASE)
 
     rebulk.defaults(name='screen_size', validator=seps_surround, abbreviations=[dash],
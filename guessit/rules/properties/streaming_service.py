@@ -5,10 +5,10 @@ streaming_service property
 """
 from rebulk.remodule import re
 
-from rebulk import Rebulk
 from rebulk.rules import Rule, RemoveMatch
 
 from ..common.pattern import is_disabled
+from ..common.keywords import KeywordRebulk
 from ...config import load_config_patterns
 from ...rules.common import seps, dash
 from ...rules.common.validators import seps_before, seps_after
@@ -22,7 +22,7 @@ def streaming_service(config):  # pylint: disable=too-many-statements,unused-arg
     :return:
     :rtype: Rebulk
     """
-    rebulk = Rebulk(disabled=lambda context: is_disabled(context, 'streaming_service'))
+    rebulk = KeywordRebulk(disabled=lambda context: is_disabled(context, 'streaming_service'))
     rebulk = rebulk.string_defaults(ignore_case=True).regex_defaults(flags=re.IGNORECASE, abbreviations=[dash])
     rebulk.defaults(name='streaming_service', tags=['source-prefix'])
 
@@ -3,12 +3,13 @@
 """
 video_codec and video_profile property
 """
-from rebulk import Rebulk, Rule, RemoveMatch
+from rebulk import Rule, RemoveMatch
 from rebulk.remodule import re
 
 from ..common import dash
 from ..common.pattern import is_disabled
 from ..common.validators import seps_after, seps_before, seps_surround
+from ..common.keywords import KeywordRebulk
 
 
 def video_codec(config):  # pylint:disable=unused-argument
@@ -20,7 +21,7 @@ def video_codec(config):  # pylint:disable=unused-argument
     :return: Created Rebulk object
     :rtype: Rebulk
     """
-    rebulk = Rebulk()
+    rebulk = KeywordRebulk()
     rebulk = rebulk.regex_defaults(flags=re.IGNORECASE, abbreviations=[dash]).string_defaults(ignore_case=True)
     rebulk.defaults(name="video_codec",
                     tags=['source-suffix', 'streaming_service.suffix'],
@@ -10,15 +10,16 @@ except ImportError:
 
 from rebulk.remodule import re
 
-from rebulk import Rebulk, Rule, RemoveMatch
+from rebulk import Rule, RemoveMatch
 from ..common import seps
 from ..common.formatters import cleanup
 from ..common.pattern import is_disabled
 from ..common.validators import seps_surround
+from ..common.keywords import KeywordRebulk
 from ...reutils import build_or_pattern
 
 
-def website(config):
+def website(config):  # pylint:disable=too-many-locals
     """
     Builder for rebulk object.
 
@@ -27,36 +28,59 @@ def website(config):
     :return: Created Rebulk object
     :rtype: Rebulk
     """
-    rebulk = Rebulk(disabled=lambda context: is_disabled(context, 'website'))
+    rebulk = KeywordRebulk(disabled=lambda context: is_disabled(context, 'website'))
     rebulk = rebulk.regex_defaults(flags=re.IGNORECASE).string_defaults(ignore_case=True)
     rebulk.defaults(name="website")
 
     data_files = files('guessit.data')
     tld_file = data_files.joinpath('tlds-alpha-by-domain.txt').read_text(encoding='utf-8')
-    tlds = [
-        tld.strip()
-        for tld in tld_file.split('\n')
+    tlds = frozenset(
+        tld.strip().lower()
+        for tld in tld_file.split('\n')[1:]
         if '--' not in tld
-    ][1:]  # All registered domain extension
+    )  # All registered domain extension
 
     safe_tlds = config['safe_tlds']  # For sure a website extension
     safe_subdomains = config['safe_subdomains']  # For sure a website subdomain
     safe_prefix = config['safe_prefixes']  # Those words before a tlds are sure
     website_prefixes = config['prefixes']
 
-    rebulk.regex(r'(?:[^a-z0-9]|^)((?:'+build_or_pattern(safe_subdomains) +
-                 r'\.)+(?:[a-z-0-9-]+\.)+(?:'+build_or_pattern(tlds) +
-                 r'))(?:[^a-z0-9]|$)',
-                 children=True)
+    subdomains_set = frozenset(subdomain.lower() for subdomain in safe_subdomains)
+    prefixes_set = frozenset(prefix.lower() for prefix in safe_prefix)
+
+    def subdomain_sizes(labels):
+        """
+        Websites starting with a safe subdomain, followed by any labels.
+        """
+        if labels[0] in subdomains_set:
+            return range(len(labels), 1, -1)
+        return ()
+
+    def prefix_sizes(labels):
+        """
+        Websites with optional safe subdomains, a label and safe prefixes.
+        """
+        subdomains_count = 0
+        while subdomains_count < len(labels) and labels[subdomains_count] in subdomains_set:
+            subdomains_count += 1
+        for label_index in range(subdomains_count, -1, -1):
+            prefixes_end = label_index + 1
+            while prefixes_end < len(labels) and labels[prefixes_end] in prefixes_set:
+                prefixes_end += 1
+            yield from range(prefixes_end, label_index + 1, -1)
+
+    subdomain_candidates = re.compile(r'(?:[^a-z0-9]|^)(?=' + build_or_pattern(safe_subdomains) + r'\.)',
+                                      re.IGNORECASE)
+    prefix_candidates = re.compile(r'(?:[^a-z0-9]|^)(?=(?:' + build_or_pattern(safe_subdomains) +
+                                   r'\.)*[a-z0-9-]+\.(?:' + build_or_pattern(safe_prefix) + r'\.))',
+                                   re.IGNORECASE)
+
+    rebulk.functional(lambda string: find_websites(string, subdomain_candidates, subdomain_sizes, tlds))
     rebulk.regex(r'(?:[^a-z0-9]|^)((?:'+build_or_pattern(safe_subdomains) +
                  r'\.)*[a-z0-9-]+\.(?:'+build_or_pattern(safe_tlds) +
                  r'))(?:[^a-z0-9]|$)',
                  safe_subdomains=safe_subdomains, safe_tlds=safe_tlds, children=True)
-    rebulk.regex(r'(?:[^a-z0-9]|^)((?:'+build_or_pattern(safe_subdomains) +
-                 r'\.)*[a-z0-9-]+\.(?:'+build_or_pattern(safe_prefix) +
-                 r'\.)+(?:'+build_or_pattern(tlds) +
-                 r'))(?:[^a-z0-9]|$)',
-                 safe_subdomains=safe_subdomains, safe_prefix=safe_prefix, tlds=tlds, children=True)
+    rebulk.functional(lambda string: find_websites(string, prefix_candidates, prefix_sizes, tlds))
 
     rebulk.string(*website_prefixes,
                   validator=seps_surround, private=True, tags=['website.prefix'])
@@ -95,6 +119,73 @@ def website(config):
     return rebulk
 
 
+_labels_re = re.compile(r'(?:[a-z0-9-]+\.)+', re.IGNORECASE)
+_last_label_re = re.compile(r'[a-z0-9]*', re.IGNORECASE)
+
+
+def _website_span(string, start, sizes, tlds):
+    """
+    Find the website starting at given position.
+
+    :param string:
+    :type string: str
+    :param start: start of the website
+    :type start: int
+    :param sizes: function giving numbers of labels the website may have before its top level domain, by preference.
+    :type sizes: callable
+    :param tlds: top level domains
+    :type tlds: frozenset
+    :return: span of the website, or None if there's no website starting at this position.
+    :rtype: tuple
+    """
+    labels_match = _labels_re.match(string, start)
+    if not labels_match:
+        return None
+    labels = labels_match.group().split('.')[:-1]
+    ends = [start]
+    for label in labels:
+        ends.append(ends[-1] + len(label) + 1)
+    for size in sizes([label.lower() for label in labels]):
+        last_label = _last_label_re.match(string, ends[size]).group()
+        if last_label.lower() in tlds:
+            return start, ends[size] + len(last_label)
+    return None
+
+
+def find_websites(string, candidates_re, sizes, tlds):
+    """
+    Find websites made of dot separated labels, where the last one is a top level domain.
+
+    Candidates positions are found with a regular expression, and labels before the top level domain are checked in
+    the order given by sizes function, so that the longest website is found like a regular expression would.
+
+    :param string:
+    :type string: str
+    :param candidates_re: regular expression matching the separator before each website candidate
+    :type candidates_re: re.Pattern
+    :param sizes: function giving numbers of labels a website may have before its top level domain, by preference.
+    :type sizes: callable
+    :param tlds: top level domains
+    :type tlds: frozenset
+    :return: spans of websites found
+    :rtype: list[tuple]
+    """
+    websites = []
+    pos = 0
+    while True:
+        candidate = candidates_re.search(string, pos)
+        if not candidate:
+            return websites
+        span = _website_span(string, candidate.end(), sizes, tlds)
+        if not span and candidate.start() == 0 and candidate.end() == 1:
+            span = _website_span(string, 0, sizes, tlds)
+        if span:
+            websites.append(span)
+            pos = span[1] + 1  # Separator following the website belongs to it.
+        else:
+            pos = candidate.start() + 1
+
+
 class ValidateWebsitePrefix(Rule):
     """
     Validate website prefixes
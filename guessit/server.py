@@ -0,0 +1,436 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Local server keeping a configured api warm behind a JSON endpoint, and its client.
+"""
+import http.client
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlsplit
+
+from .api import GuessItApi
+from .jsonutils import GuessitEncoder
+from .options import parse_options
+
+default_address = '127.0.0.1:8910'
+
+# Options that requests may give. Configuration files and advanced configuration can only be set when the server is
+# started, so that clients can't make the server read files or build other rules.
+request_options = frozenset(['type', 'name_only', 'date_year_first', 'date_day_first', 'allowed_languages',
+                             'allowed_countries', 'episode_prefer_number', 'expected_title', 'expected_group',
+                             'includes', 'excludes', 'advanced', 'single_value', 'enforce_list',
+                             'output_input_string'])
+
+_unix_prefix = 'unix:'
+
+
+def _is_unix_address(address):
+    return address.startswith(_unix_prefix) or os.sep in address
+
+
+def _unix_path(address):
+    return address[len(_unix_prefix):] if address.startswith(_unix_prefix) else address
+
+
+def _tcp_address(address):
+    host, _, port = address.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+def parse_request_options(options):
+    """
+    Parse options given by a request, keeping only defined options.
+    :param options:
+    :type options: str|dict
+    :return:
+    :rtype: dict
+    :raises ValueError: if options are invalid, or if some of them are not allowed in requests.
+    """
+    if options is None:
+        return None
+    if not isinstance(options, (str, dict)):
+        raise ValueError('"options" should be a string or a JSON object')
+    try:
+        options = parse_options(options, True)
+    except SystemExit as err:
+        raise ValueError(f'Invalid options: {options}') from err
+    options = {option: value for option, value in options.items() if value is not None and value != []}
+    refused = sorted(option for option in options if option not in request_options)
+    if refused:
+        raise ValueError(f'Options not allowed in requests: {", ".join(refused)}')
+    return options
+
+
+class _BatchRequest:  # pylint:disable=too-few-public-methods
+    """
+    Strings to guess for a single request, waiting for their results.
+    """
+
+    def __init__(self, strings, options):
+        self.strings = strings
+        self.options = options
+        self.results = None
+        self.done = threading.Event()
+
+
+class MicroBatcher:
+    """
+    Collect strings from concurrent requests and guess them together with `GuessItApi.guessit_many`.
+
+    A single thread runs all guesses, so the api is never used concurrently. It waits at most max_delay seconds for
+    other requests to join a batch, and starts guessing as soon as max_batch_size strings are collected.
+    """
+
+    def __init__(self, api, options=None, max_batch_size=256, max_delay=0.002):
+        """
+        :param api: configured api
+        :type api: GuessItApi
+        :param options: options used for all requests, that request options may override.
+        :type options: dict
+        :param max_batch_size: maximum number of strings to guess in a batch
+        :type max_batch_size: int
+        :param max_delay: maximum time to wait for other requests, in seconds
+        :type max_delay: float
+        """
+        self.api = api
+        self.options = options
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._requests = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='guessit-batcher', daemon=True)
+        self._thread.start()
+
+    def guessit_many(self, strings, options=None):
+        """
+        Guess strings, waiting for their batch to be processed.
+        :param strings:
+        :type strings: list
+        :param options: request options
+        :type options: str|dict
+        :return: results in input order, with a GuessitException for strings that failed to be guessed.
+        :rtype: list
+        """
+        request = _BatchRequest(strings, options)
+        self._requests.put(request)
+        request.done.wait()
+        return request.results
+
+    def _next_batch(self):
+        request = self._requests.get()
+        if request is None:
+            return None
+        batch = [request]
+        size = len(request.strings)
+        deadline = time.monotonic() + self.max_delay
+        while size < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                request = self._requests.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if request is None:
+                self._requests.put(None)
+                break
+            batch.append(request)
+            size += len(request.strings)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            items = [(string, request.options) for request in batch for string in request.strings]
+            try:
+                results = self.api.guessit_many(items, self.options)
+            except Exception as err:  # pylint:disable=broad-except
+                results = [err] * len(items)
+            i = 0
+            for request in batch:
+                request.results = results[i:i + len(request.strings)]
+                i += len(request.strings)
+                request.done.set()
+
+    def close(self):
+        """
+        Stop batching thread once pending requests are processed.
+        """
+        self._requests.put(None)
+        self._thread.join()
+
+
+class GuessItRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON endpoints of the server.
+
+    GET /guess?string=...&options=... and POST /guess with {"string": ..., "options": ...} guess a single string.
+    POST /guess_many with {"strings": [...], "options": ...} guess many strings.
+
+    Requests may only give the options of `request_options`, other options are refused with a 400 error.
+    """
+
+    server_version = 'GuessIt'
+
+    def address_string(self):
+        if isinstance(self.client_address, tuple):
+            return super().address_string()
+        return 'unix'
+
+    def log_message(self, format, *args):  # pylint:disable=redefined-builtin
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, data):
+        body = json.dumps(data, cls=GuessitEncoder, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        data = json.loads(self.rfile.read(length).decode('utf-8')) if length else {}
+        if not isinstance(data, dict):
+            raise ValueError('Request body should be a JSON object')
+        return data
+
+    def _parse_options(self, options):
+        """
+        Parse request options, sending an error response if they are refused.
+        :return: parsed options, and whether they are valid.
+        :rtype: tuple
+        """
+        try:
+            return parse_request_options(options), True
+        except ValueError as err:
+            self._send_json(400, {'error': str(err)})
+            return None, False
+
+    def _guess(self, string, options):
+        if not isinstance(string, str):
+            self._send_json(400, {'error': 'A "string" value is required'})
+            return
+        options, valid = self._parse_options(options)
+        if not valid:
+            return
+        result = self.server.batcher.guessit_many([string], options)[0]
+        if isinstance(result, Exception):
+            self._send_json(500, {'error': str(result)})
+        else:
+            self._send_json(200, result)
+
+    def _guess_many(self, strings, options):
+        if not isinstance(strings, list) or not all(isinstance(string, str) for string in strings):
+            self._send_json(400, {'error': 'A "strings" list is required'})
+            return
+        options, valid = self._parse_options(options)
+        if not valid:
+            return
+        results = self.server.batcher.guessit_many(strings, options)
+        self._send_json(200, [{'error': str(result)} if isinstance(result, Exception) else result
+                              for result in results])
+
+    def do_GET(self):  # pylint:disable=invalid-name
+        """Handle GET requests"""
+        url = urlsplit(self.path)
+        if url.path != '/guess':
+            self._send_json(404, {'error': f'Unknown endpoint "{url.path}"'})
+            return
+        query = parse_qs(url.query)
+        self._guess(query.get('string', [None])[0], query.get('options', [None])[0])
+
+    def do_POST(self):  # pylint:disable=invalid-name
+        """Handle POST requests"""
+        url = urlsplit(self.path)
+        if url.path not in ('/guess', '/guess_many'):
+            self._send_json(404, {'error': f'Unknown endpoint "{url.path}"'})
+            return
+        try:
+            data = self._read_json()
+        except ValueError as err:
+            self._send_json(400, {'error': str(err)})
+            return
+        if url.path == '/guess':
+            self._guess(data.get('string'), data.get('options'))
+        else:
+            self._guess_many(data.get('strings'), data.get('options'))
+
+
+class _ServerMixin:
+    """
+    Attributes shared by TCP and unix socket servers.
+    """
+    batcher = None
+    verbose = False
+
+    def server_close(self):
+        """Stop server and its batcher"""
+        super().server_close()
+        if self.batcher:
+            self.batcher.close()
+
+
+class GuessItHTTPServer(_ServerMixin, ThreadingHTTPServer):
+    """
+    HTTP server listening on a TCP address.
+    """
+
+
+class GuessItUnixHTTPServer(_ServerMixin, socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    HTTP server listening on a unix socket.
+    """
+    address_family = getattr(socket, 'AF_UNIX', None)
+    daemon_threads = True
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+def create_server(address=default_address, options=None, api=None, **batcher_kwargs):
+    """
+    Create a server with a configured api, without starting it.
+    :param address: "host:port" TCP address, or unix socket path (absolute or prefixed with "unix:").
+    :type address: str
+    :param options: options used for all requests, that request options may override.
+    :type options: dict
+    :param api: api to use, a new GuessItApi if not given.
+    :type api: GuessItApi
+    :param batcher_kwargs: MicroBatcher parameters (max_batch_size, max_delay)
+    :return: the server, ready to serve_forever()
+    """
+    if api is None:
+        api = GuessItApi()
+    api.configure(options)
+
+    if _is_unix_address(address):
+        server = GuessItUnixHTTPServer(_unix_path(address), GuessItRequestHandler)
+    else:
+        server = GuessItHTTPServer(_tcp_address(address), GuessItRequestHandler)
+    server.batcher = MicroBatcher(api, options, **batcher_kwargs)
+    server.verbose = bool(options and options.get('verbose'))
+    return server
+
+
+def serve(address=default_address, options=None, api=None):
+    """
+    Serve guesses until interrupted.
+    :param address: "host:port" TCP address, or unix socket path (absolute or prefixed with "unix:").
+    :type address: str
+    :param options:
+    :type options: dict
+    :param api: api to use, a new GuessItApi if not given.
+    :type api: GuessItApi
+    """
+    server = create_server(address, options, api)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:  # pragma: no cover
+        pass
+    finally:
+        server.server_close()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """
+    HTTP connection over a unix socket.
+    """
+
+    def __init__(self, path, timeout=None):
+        super().__init__('localhost', timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+
+class GuessItClient:
+    """
+    Client of a guessit server.
+
+    Guesses are returned as decoded JSON, so babelfish and quantity values are strings.
+    """
+
+    def __init__(self, address=default_address, timeout=None):
+        """
+        :param address: "host:port" TCP address, or unix socket path (absolute or prefixed with "unix:").
+        :type address: str
+        :param timeout: socket timeout, in seconds
+        :type timeout: float
+        """
+        self.address = address
+        self.timeout = timeout
+
+    def _connection(self):
+        if _is_unix_address(self.address):
+            return _UnixHTTPConnection(_unix_path(self.address), timeout=self.timeout)
+        host, port = _tcp_address(self.address)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _request(self, method, url, data=None):
+        connection = self._connection()
+        try:
+            body = json.dumps(data).encode('utf-8') if data is not None else None
+            headers = {'Content-Type': 'application/json'} if body is not None else {}
+            connection.request(method, url, body, headers)
+            response = connection.getresponse()
+            result = json.loads(response.read().decode('utf-8'))
+        finally:
+            connection.close()
+        if response.status != 200:
+            raise GuessItClientError(response.status, result.get('error'))
+        return result
+
+    def guessit(self, string, options=None):
+        """
+        Retrieves all matches from string as a dict
+        :param string: the filename or release name
+        :type string: str
+        :param options:
+        :type options: str|dict
+        :return:
+        :rtype: dict
+        """
+        if options is None or isinstance(options, str):
+            url = '/guess?string=' + quote(string)
+            if options:
+                url += '&options=' + quote(options)
+            return self._request('GET', url)
+        return self._request('POST', '/guess', {'string': string, 'options': options})
+
+    def guessit_many(self, strings, options=None):
+        """
+        Retrieves all matches from each string as a list of dict
+        :param strings: the filenames or release names
+        :type strings: list
+        :param options:
+        :type options: str|dict
+        :return: results in input order, with an {"error": ...} dict for strings that failed to be guessed.
+        :rtype: list
+        """
+        return self._request('POST', '/guess_many', {'strings': list(strings), 'options': options})
+
+
+class GuessItClientError(Exception):
+    """
+    Exception raised when the server fails to answer a request.
+    """
+
+    def __init__(self, status, message):
+        super().__init__(f'{status}: {message}')
+        self.status = status
+        self.message = message
@@ -3,13 +3,24 @@
 # pylint: disable=pointless-statement, missing-docstring, invalid-name, pointless-string-statement
 import json
 import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 from pytest_mock import MockerFixture
+from rebulk import Rebulk
+from rebulk.pattern import StringPattern
 
 from .. import api
-from ..api import guessit, properties, suggested_expected, GuessitException, default_api
+from ..cache import SqliteCache
+from ..rules.common import expected, words
+from ..rules.common.words import InputAnalysis
+from ..rules.common.keywords import KeywordPattern, KeywordRebulk, use_keyword_automaton
+from ..rules.properties import country, language, mimetype
+from ..api import guessit, guessit_many, properties, suggested_expected, GuessitException, GuessItApi, \
+    default_api
 
 __location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
 
@@ -114,3 +125,376 @@ def test_should_not_rebuild_rebulk_on_same_advanced_config(mocker: MockerFixture
 
     assert rebulk_builder_spy.call_count == 0
     rebulk_builder_spy.reset_mock()
+
+
+def test_guessit_many():
+    strings = ['Fear.and.Loathing.in.Las.Vegas.FRENCH.ENGLISH.720p.HDDVD.DTS.x264-ESiR.mkv',
+               'Dexter.5x02.Hello,.Bandit.ENG.-.sub.FR.HDTV.XviD-AlFleNi-TeaM.[tvu.org.ru].avi']
+    results = guessit_many(strings)
+    assert results == [guessit(string) for string in strings]
+
+
+def test_guessit_many_item_options():
+    string = 'some.movie.trfr.mkv'
+    results = guessit_many([string,
+                            (string, {'advanced_config': {'language': {'subtitle_prefixes': ['tr']}}}),
+                            (string, '-t episode')], {'single_value': True})
+
+    assert results[0].get('title') == 'some movie trfr'
+    assert results[1].get('title') == 'some movie'
+    assert str(results[1].get('subtitle_language')) == 'fr'
+    assert results[2].get('type') == 'episode'
+
+
+def test_guessit_many_should_configure_once_per_group(mocker: MockerFixture):
+    api.reset()
+    configure_spy = mocker.spy(default_api, 'configure')
+
+    results = guessit_many(['first.movie.mkv', 'second.movie.mkv', ('third.movie.mkv', {'type': 'episode'}),
+                            ('fourth.movie.mkv', {'type': 'episode'})])
+
+    assert [result.get('title') for result in results] == ['first movie', 'second movie', 'third movie',
+                                                          'fourth movie']
+    assert configure_spy.call_count == 2
+
+
+def test_guessit_many_exception():
+    results = guessit_many(['first.movie.mkv', object(), 'second.movie.mkv'])
+
+    assert results[0].get('title') == 'first movie'
+    assert isinstance(results[1], GuessitException)
+    assert "An internal error has occurred in guessit" in str(results[1])
+    assert results[2].get('title') == 'second movie'
+
+
+def test_guessit_many_item_options_exception():
+    results = guessit_many(['first.movie.mkv', ('second.movie.mkv', ['-t', 'episode']),
+                            ('third.movie.mkv', '--bogus'), ('fourth.movie.mkv', {}, 'extra'),
+                            ('fifth.movie.mkv', '-t episode')])
+
+    assert results[0].get('title') == 'first movie'
+    assert results[1].get('type') == 'episode'
+    assert isinstance(results[2], GuessitException)
+    assert isinstance(results[3], GuessitException)
+    assert results[4].get('type') == 'episode'
+
+
+def test_input_words_are_scanned_once(mocker: MockerFixture):
+    iter_words_spy = mocker.spy(words, 'iter_words')
+
+    guess = guessit('Show.US.S01E01.FRENCH.mkv', {'allowed_countries': ['us'], 'allowed_languages': ['fr']})
+
+    assert guess['country'] == 'US'
+    assert guess['language'] == 'fr'
+    assert iter_words_spy.call_count == 1
+    for string in ('Some.MOVIE.mkv', 'İstanbul.Movie.mkv'):
+        assert InputAnalysis(string).lower_words == tuple(words.iter_words(string.lower()))
+
+
+def test_finders_are_bounded(mocker: MockerFixture):
+    mocker.patch.object(country, '_finders_maxsize', 2)
+    mocker.patch.object(language, '_finders_maxsize', 2)
+    country_finder_spy = mocker.spy(country, 'CountryFinder')
+    language_finder_spy = mocker.spy(language, 'LanguageFinder')
+
+    # Allowed values are added to the default ones, so each set must have a value that isn't allowed by default.
+    for allowed in (['br', 'da'], ['mx', 'fi'], ['ar', 'el'], ['br', 'da']):
+        guessit('Show.US.S01E01.FRENCH.mkv', {'allowed_countries': allowed[:1], 'allowed_languages': allowed[1:]})
+
+    assert country_finder_spy.call_count == 4
+    assert language_finder_spy.call_count == 4
+
+
+def test_language_lexicon_is_shared(mocker: MockerFixture):
+    mocker.patch.object(language, '_lexicons', {})
+    build_spy = mocker.spy(language.GuessitConverter, '_build_lexicon')
+
+    converters = [language.GuessitConverter({'fra': ['vff']}) for _ in range(2)]
+    other_converter = language.GuessitConverter({'por_BR': ['vff']})
+
+    assert build_spy.call_count == 2
+    assert converters[0].reverse('vff') == converters[1].reverse('vff') == ('fra', None, None)
+    assert other_converter.reverse('vff') == ('por', 'BR', None)
+
+
+def test_cache():
+    cached_api = GuessItApi(cache=2)
+
+    result1 = cached_api.guessit('some.movie.mkv')
+    result1['title'] = 'mutated'
+    result2 = cached_api.guessit('some.movie.mkv')
+    result2['title'] = 'mutated again'
+
+    assert cached_api.guessit('some.movie.mkv')['title'] == 'some movie'
+    assert cached_api.guessit('some.movie.mkv', {'type': 'episode'})['type'] == 'episode'
+    assert cached_api.cache_stats() == {'hits': 2, 'misses': 2, 'evictions': 0, 'size': 2, 'maxsize': 2}
+
+    cached_api.guessit('other.movie.mkv')
+    assert cached_api.cache_stats()['evictions'] == 1
+
+    cached_api.guessit('some.movie.mkv', {'type': 'episode'})
+    assert cached_api.cache_stats()['hits'] == 3
+
+
+def test_cache_copy_lists():
+    cached_api = GuessItApi(cache=10)
+
+    cached_api.guessit('some.movie.FRENCH.ENGLISH.mkv')['language'].append('mutated')
+
+    assert len(cached_api.guessit('some.movie.FRENCH.ENGLISH.mkv')['language']) == 2
+
+
+def test_cache_copy_matches():
+    cached_api = GuessItApi(cache=10)
+
+    cached_api.guessit('some.movie.FRENCH.ENGLISH.mkv', {'advanced': True})['title'].value = 'mutated'
+    cached_api.guessit('some.movie.FRENCH.ENGLISH.mkv', {'advanced': True})['language'][0].value = 'mutated'
+    guess = cached_api.guessit('some.movie.FRENCH.ENGLISH.mkv', {'advanced': True})
+
+    assert guess['title'].value == 'some movie'
+    assert str(guess['language'][0].value) == 'fr'
+    assert cached_api.cache_stats()['hits'] == 2
+
+
+def test_cache_advanced_config():
+    cached_api = GuessItApi(cache=10)
+
+    result1 = cached_api.guessit('some.movie.trfr.mkv')
+    result2 = cached_api.guessit('some.movie.trfr.mkv',
+                                 {'advanced_config': {'language': {'subtitle_prefixes': ['tr']}}})
+
+    assert result1.get('title') == 'some movie trfr'
+    assert result2.get('title') == 'some movie'
+    assert cached_api.cache_stats()['hits'] == 0
+
+
+def test_cache_guessit_many():
+    cached_api = GuessItApi(cache=10)
+
+    cached_api.guessit_many(['first.movie.mkv', 'second.movie.mkv'])
+    results = cached_api.guessit_many(['first.movie.mkv', 'third.movie.mkv'])
+
+    assert [result['title'] for result in results] == ['first movie', 'third movie']
+    assert cached_api.cache_stats()['hits'] == 1
+    assert cached_api.cache_stats()['misses'] == 3
+
+
+def test_cache_invalidation():
+    cached_api = GuessItApi(cache=10)
+
+    cached_api.guessit('some.movie.mkv')
+    cached_api.configure(force=True)
+    assert cached_api.cache_stats()['size'] == 0
+
+    cached_api.guessit('some.movie.mkv')
+    cached_api.reset()
+    assert cached_api.cache_stats()['size'] == 0
+
+    assert cached_api.guessit('some.movie.mkv')['title'] == 'some movie'
+
+
+def test_no_cache():
+    assert GuessItApi().cache_stats() is None
+
+
+def test_sqlite_cache(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+
+    cached_api = GuessItApi(cache=path)
+    result1 = cached_api.guessit('some.movie.FRENCH.1.4GB.mkv')
+    cached_api.guessit_many(['first.movie.mkv', 'second.movie.mkv'])
+    cached_api.cache.close()
+
+    cached_api = GuessItApi(cache=path)
+    result2 = cached_api.guessit('some.movie.FRENCH.1.4GB.mkv')
+    results = cached_api.guessit_many(['first.movie.mkv', 'second.movie.mkv', 'third.movie.mkv'])
+
+    assert result2 == result1
+    assert str(result2['language']) == 'fr'
+    assert [result['title'] for result in results] == ['first movie', 'second movie', 'third movie']
+    assert cached_api.cache_stats() == {'hits': 3, 'misses': 1, 'evictions': 0, 'size': 4, 'maxsize': None}
+
+    assert cached_api.guessit('some.movie.FRENCH.1.4GB.mkv', {'type': 'episode'})['type'] == 'episode'
+    assert cached_api.guessit('first.movie.mkv', {'advanced': True})['title'].value == 'first movie'
+    assert cached_api.cache_stats()['size'] == 5
+    cached_api.cache.close()
+
+
+def test_sqlite_cache_version(tmp_path, mocker: MockerFixture):
+    path = tmp_path / 'cache.sqlite'
+
+    with SqliteCache(path) as cache:
+        cache.set(('some.movie.mkv', 'options'), {'title': 'some movie'})
+
+    with SqliteCache(path) as cache:
+        assert cache.get(('some.movie.mkv', 'options')) == {'title': 'some movie'}
+        assert cache.get(('some.movie.mkv', 'other options')) is None
+
+    mocker.patch('guessit.cache.__version__', 'next')
+    with SqliteCache(path) as cache:
+        assert cache.get(('some.movie.mkv', 'options')) is None
+        assert len(cache) == 0
+
+
+def test_sqlite_cache_maxsize(tmp_path):
+    with SqliteCache(tmp_path / 'cache.sqlite', maxsize=2, batch_size=1) as cache:
+        for i in range(5):
+            cache.set((f'movie.{i}.mkv', 'options'), {'title': f'movie {i}'})
+        cache.vacuum()
+
+        assert cache.get(('movie.0.mkv', 'options')) is None
+        assert cache.get(('movie.4.mkv', 'options')) == {'title': 'movie 4'}
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 3, 'size': 2, 'maxsize': 2}
+
+
+def test_sqlite_cache_config_file(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    config = tmp_path / 'config.json'
+    options = {'config': [str(config)], 'no_user_config': True}
+
+    config.write_text('{"type": "movie"}', encoding='utf-8')
+    with SqliteCache(path) as cache:
+        assert GuessItApi(cache=cache).guessit('some.show.mkv', options)['type'] == 'movie'
+
+    config.write_text('{"type": "episode"}', encoding='utf-8')
+    with SqliteCache(path) as cache:
+        assert GuessItApi(cache=cache).guessit('some.show.mkv', options)['type'] == 'episode'
+        assert cache.stats()['hits'] == 0
+
+
+def test_sqlite_cache_counts_entries_once(tmp_path, mocker: MockerFixture):
+    with SqliteCache(tmp_path / 'cache.sqlite', maxsize=3, batch_size=1) as cache:
+        count_spy = mocker.spy(cache, '_stored_count')
+        for i in range(5):
+            cache.set((f'movie.{i}.mkv', 'options'), {'title': f'movie {i}'})
+        cache.set(('movie.4.mkv', 'options'), {'title': 'movie 4 again'})
+
+        assert count_spy.call_count == 0
+        assert cache.get(('movie.4.mkv', 'options')) == {'title': 'movie 4 again'}
+        assert cache.stats() == {'hits': 1, 'misses': 0, 'evictions': 2, 'size': 3, 'maxsize': 3}
+
+
+def test_sqlite_cache_written_at_exit(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    script = ('import sys; from guessit import GuessItApi; cached_api = GuessItApi(cache=sys.argv[1]); '
+              'cached_api.guessit("some.movie.mkv"); print(cached_api.cache_stats()["hits"])')
+
+    outputs = [subprocess.run([sys.executable, '-c', script, str(path)], capture_output=True, text=True,
+                              check=True).stdout.strip() for _ in range(2)]
+
+    assert outputs == ['0', '1']
+
+
+def test_sqlite_cache_kept_on_reset(tmp_path):
+    with GuessItApi(cache=tmp_path / 'cache.sqlite') as cached_api:
+        cached_api.guessit_many(['some.movie.mkv'])
+        cached_api.configure(force=True)
+        cached_api.reset()
+
+        cached_api.guessit('some.movie.mkv')
+        assert cached_api.cache_stats()['hits'] == 1
+
+
+def test_sqlite_cache_pending_entries_count(tmp_path):
+    with SqliteCache(tmp_path / 'cache.sqlite') as cache:
+        cache.set_many([(('movie.1.mkv', 'options'), {'title': 'movie 1'})])
+        cache.set(('movie.1.mkv', 'options'), {'title': 'movie 1 again'})
+        cache.set(('movie.2.mkv', 'options'), {'title': 'movie 2'})
+
+        assert len(cache) == 2
+
+
+def test_sqlite_cache_threads(tmp_path):
+    with GuessItApi(cache=tmp_path / 'cache.sqlite') as cached_api:
+        cached_api.guessit('some.movie.mkv')
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(cached_api.guessit, ['some.movie.mkv', 'other.movie.mkv']))
+
+        assert [result['title'] for result in results] == ['some movie', 'other movie']
+        assert cached_api.cache_stats()['hits'] == 1
+
+
+def test_rules_are_shared_by_api_instances(mocker: MockerFixture):
+    rebulk_builder_spy = mocker.spy(api, 'rebulk_builder')
+
+    GuessItApi().guessit('some.movie.mkv')
+    GuessItApi().guessit('some.movie.mkv')
+    rebulk_builder_spy.assert_called_once_with(mocker.ANY)
+
+    GuessItApi().configure(force=True)
+    assert rebulk_builder_spy.call_count == 2
+
+
+def test_rules_are_pruned_for_includes_and_excludes(mocker: MockerFixture):
+    rebulk_builder_spy = mocker.spy(api, 'rebulk_builder')
+    options = {'includes': ['season', 'episode']}
+
+    guess = GuessItApi().guessit('Show.Name.S01E02.720p.HDTV.x264-GRP.mkv', options)
+    assert guess == {'season': 1, 'episode': 2}
+    rebulk_builder_spy.assert_called_with(mocker.ANY, frozenset(['season', 'episode']), frozenset())
+    assert len(rebulk_builder_spy.spy_return.effective_patterns()) < \
+           len(default_api.rebulk.effective_patterns())
+
+    calls = rebulk_builder_spy.call_count
+    GuessItApi().guessit('Another.Show.S02E03.mkv', options)
+    assert rebulk_builder_spy.call_count == calls
+
+
+def test_string_patterns_share_a_keyword_automaton():
+    patterns = [pattern for pattern in default_api.rebulk.effective_patterns() if isinstance(pattern, StringPattern)]
+    keyword_patterns = [pattern for pattern in patterns if isinstance(pattern, KeywordPattern)]
+    assert keyword_patterns
+    assert len({id(pattern.automaton) for pattern in keyword_patterns}) == 1
+
+    guess = default_api.guessit('Movie.Name.2019.1080p.BluRay.DTS-HD.MA.x264-GRP.mkv')
+    assert guess['audio_codec'] == 'DTS-HD'
+    assert guess['audio_profile'] == 'Master Audio'
+
+
+def test_keyword_rebulk_matches_as_rebulk():
+    # Keyword patterns are built from string patterns built by rebulk, and must match as them.
+    def build(rebulk):
+        return rebulk.string_defaults(ignore_case=True) \
+            .defaults(name='codec', tags=['audio'], formatter=str.upper) \
+            .string('DTS-HD', 'dts', 'HD') \
+            .string('hd', start=10, name='other')
+
+    keyword_rebulk = build(KeywordRebulk())
+    rebulk = build(Rebulk())
+    assert [type(pattern) for pattern in keyword_rebulk.effective_patterns()] == [KeywordPattern, StringPattern]
+    assert use_keyword_automaton(keyword_rebulk.effective_patterns())
+
+    input_string = 'Movie.dts-hd.DTS.Hd.mkv'
+    assert [(match.span, match.name, match.tags, match.value) for match in keyword_rebulk.matches(input_string)] == \
+           [(match.span, match.name, match.tags, match.value) for match in rebulk.matches(input_string)]
+
+
+def test_expected_searches_are_prepared_once(mocker: MockerFixture):
+    compile_spy = mocker.spy(expected.re, 'compile')
+    options = {'expected_title': ['re:Some Show', 'OSS 117']}
+
+    assert guessit('Some.Show.S01E02.mkv', options)['title'] == 'Some Show'
+    assert guessit('OSS.117.Lost.in.Rio.mkv', options)['title'] == 'OSS 117'
+    assert compile_spy.call_count == 1
+
+
+def test_expected_titles_are_indexed():
+    titles = [f'Known Show {i}' for i in range(1000)] + ['The Walking Dead']
+    searches = expected.prepare_expected(tuple(titles))
+    assert searches.automaton
+
+    guess = guessit('the_walking.dead.S01E02.720p.HDTV.x264-GRP.mkv', {'expected_title': titles})
+    assert guess['title'] == 'the walking dead'
+    assert guess['episode'] == 2
+
+
+def test_mimetype_of_container_extensions_is_precomputed(mocker: MockerFixture):
+    default_api.guessit('some.movie.mkv')
+    guess_type_spy = mocker.spy(mimetype.mimetypes, 'guess_type')
+
+    assert default_api.guessit('some.movie.mkv')['mimetype'] == 'video/x-matroska'
+    assert default_api.guessit('some.movie.MP4')['mimetype'] == 'video/mp4'
+    assert guess_type_spy.call_count == 0
+
+    assert default_api.guessit('some.movie.mkv.gz')['mimetype'] == 'video/x-matroska'
+    assert guess_type_spy.call_count == 1
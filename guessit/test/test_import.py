@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=pointless-statement, missing-docstring, invalid-name
+import subprocess
+import sys
+
+lazy_modules = ('argparse', 'babelfish', 'dateutil', 'yaml', 'sqlite3', 'guessit.rules.builder',
+                'guessit.rules.properties')
+
+
+def _imported_modules(module):
+    """
+    Import a module in a new interpreter.
+    :return: names of modules loaded after the import.
+    :rtype: list
+    """
+    process = subprocess.run([sys.executable, '-c', f'import sys, {module}; print("\\n".join(sys.modules))'],
+                             capture_output=True, text=True, check=True)
+    return process.stdout.splitlines()
+
+
+def test_import_is_lazy():
+    modules = _imported_modules('guessit')
+
+    assert 'guessit' in modules
+    for module in modules:
+        assert not module.startswith(lazy_modules), f'{module} should not be imported by "import guessit"'
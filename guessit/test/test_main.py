@@ -1,14 +1,19 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # pylint: disable=pointless-statement, missing-docstring, invalid-name
+import io
 import json
 import os
 import sys
 
 import pytest
 from _pytest.capture import CaptureFixture
+from pytest_mock import MockerFixture
 
 from ..__main__ import main
+from ..api import guessit
+from ..cache import SqliteCache
+from ..jsonutils import NdjsonWriter
 
 __location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
 
@@ -98,3 +103,142 @@ def test_json_no_output_input_string(capsys: CaptureFixture):
     data = json.loads(outerr.out)
 
     assert 'input_string' not in data
+
+
+def test_main_jobs(capsys: CaptureFixture, tmp_path):
+    filenames = [f'Show.S01E{episode:02d}.mkv' for episode in range(1, 11)]
+    input_file = tmp_path / 'input.txt'
+    input_file.write_text('\n'.join(filenames), encoding='utf-8')
+
+    main(['--json', '--output-input-string', '--jobs', '2', '--input-file', str(input_file)])
+
+    outerr = capsys.readouterr()
+    data = [json.loads(line) for line in outerr.out.splitlines()]
+
+    assert [item['input_string'] for item in data] == filenames
+    assert [item['episode'] for item in data] == list(range(1, 11))
+
+
+def test_main_jobs_show_property(capsys: CaptureFixture):
+    main(['-J', '2', '-P', 'episode', 'Show.S01E01.mkv', 'Show.S01E02.mkv'])
+
+    outerr = capsys.readouterr()
+    assert outerr.out.splitlines() == ['1', '2']
+
+
+def test_main_input_stdin(capsys: CaptureFixture, monkeypatch):
+    monkeypatch.setattr(sys, 'stdin', io.StringIO('Show.S01E01.mkv\n\n  Show.S01E02.mkv  \n'))
+
+    main(['-P', 'episode', '-f', '-'])
+
+    outerr = capsys.readouterr()
+    assert outerr.out.splitlines() == ['1', '2']
+
+
+def test_main_input_is_streamed(monkeypatch, mocker):
+    guess_filename = mocker.patch('guessit.__main__.guess_filename')
+
+    def stdin():
+        yield 'Show.S01E01.mkv\n'
+        assert guess_filename.call_count == 1
+        yield 'Show.S01E02.mkv\n'
+
+    monkeypatch.setattr(sys, 'stdin', stdin())
+
+    main(['-f', '-'])
+
+    assert guess_filename.call_count == 2
+
+
+def test_main_ndjson(capsys: CaptureFixture):
+    main(['--ndjson', 'Show.S01E01.FRENCH.1.4GB.mkv', 'Other.Show.S01E02.mkv'])
+
+    outerr = capsys.readouterr()
+    lines = outerr.out.splitlines()
+    data = [json.loads(line) for line in lines]
+
+    assert len(lines) == 2
+    assert '": ' not in lines[1]
+    assert [item['input_string'] for item in data] == ['Show.S01E01.FRENCH.1.4GB.mkv', 'Other.Show.S01E02.mkv']
+    assert data[0]['language'] == 'French'
+    assert data[0]['size'] == '1.4GB'
+
+
+def test_main_ndjson_jobs(capsys: CaptureFixture):
+    main(['--ndjson', '-J', '2', 'Show.S01E01.mkv', 'Show.S01E02.mkv'])
+
+    outerr = capsys.readouterr()
+    data = [json.loads(line) for line in outerr.out.splitlines()]
+
+    assert [item['episode'] for item in data] == [1, 2]
+
+
+def test_ndjson_writer_buffers_lines(mocker: MockerFixture):
+    stream = io.StringIO()
+    write_spy = mocker.spy(stream, 'write')
+    writer = NdjsonWriter(stream, buffer_size=2, flush_interval=60)
+
+    for episode in range(1, 4):
+        writer.write(f'Show.S01E0{episode}.mkv', {'episode': episode})
+    assert [json.loads(line)['episode'] for line in stream.getvalue().splitlines()] == [1, 2]
+    assert write_spy.call_count == 1
+
+    writer.flush()
+    assert [json.loads(line)['episode'] for line in stream.getvalue().splitlines()] == [1, 2, 3]
+    assert write_spy.call_count == 2
+
+
+def test_ndjson_writer_flush_interval(mocker: MockerFixture):
+    stream = io.StringIO()
+    writer = NdjsonWriter(stream, flush_interval=0)
+
+    writer.write('Show.S01E01.mkv', guessit('Show.S01E01.mkv'))
+    assert json.loads(stream.getvalue())['episode'] == 1
+
+    tty_stream = io.StringIO()
+    mocker.patch.object(tty_stream, 'isatty', return_value=True)
+    writer = NdjsonWriter(tty_stream, flush_interval=60)
+
+    writer.write('Show.S01E02.mkv', guessit('Show.S01E02.mkv'))
+    assert json.loads(tty_stream.getvalue())['episode'] == 2
+
+
+def test_main_cache(capsys: CaptureFixture, tmp_path):
+    cache = str(tmp_path / 'cache.sqlite')
+
+    main(['--cache', cache, '-P', 'episode', 'Show.S01E01.mkv', 'Show.S01E02.mkv'])
+    main(['--cache', cache, '-J', '2', '-P', 'episode', 'Show.S01E01.mkv', 'Show.S01E03.mkv'])
+    main(['--cache', cache, '-P', 'episode', 'Show.S01E01.mkv', 'Show.S01E03.mkv'])
+
+    outerr = capsys.readouterr()
+    assert outerr.out.splitlines() == ['1', '2', '1', '3', '1', '3']
+
+    with SqliteCache(cache) as sqlite_cache:
+        assert len(sqlite_cache) == 3
+
+
+def test_main_serve(mocker):
+    serve = mocker.patch('guessit.server.serve')
+
+    main(['--serve', '--listen', 'unix:/tmp/guessit.sock', '-t', 'episode'])
+
+    serve.assert_called_once_with('unix:/tmp/guessit.sock', mocker.ANY, mocker.ANY)
+    assert serve.call_args[0][1]['type'] == 'episode'
+    assert serve.call_args[0][2].cache is None
+
+
+def test_main_serve_cache(mocker: MockerFixture, tmp_path):
+    serve = mocker.patch('guessit.server.serve')
+
+    main(['--serve', '--cache', str(tmp_path / 'cache.sqlite')])
+
+    assert isinstance(serve.call_args[0][2].cache, SqliteCache)
+
+
+def test_main_serve_filenames(mocker: MockerFixture):
+    serve = mocker.patch('guessit.server.serve')
+
+    for args in (['--serve', 'Show.S01E01.mkv'], ['--serve', '-f', 'filenames.txt']):
+        with pytest.raises(SystemExit):
+            main(args)
+    assert serve.call_count == 0
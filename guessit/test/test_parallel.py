@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=pointless-statement, missing-docstring, invalid-name
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from pytest_mock import MockerFixture
+
+from .. import api
+from ..api import guessit, GuessitException
+from ..parallel import GuessItExecutor, guessit_parallel
+
+__location__ = os.path.realpath(os.path.join(os.getcwd(), os.path.dirname(__file__)))
+
+
+def _input_strings():
+    with open(os.path.join(__location__, 'test-input-file.txt'), 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def test_guessit_parallel():
+    strings = _input_strings()
+    results = guessit_parallel(strings, max_workers=2, chunk_size=1)
+    assert results == [guessit(string) for string in strings]
+
+
+def test_guessit_parallel_options():
+    results = guessit_parallel(['some.movie.trfr.mkv', ('other.movie.mkv', {'type': 'episode'})],
+                               {'advanced_config': {'language': {'subtitle_prefixes': ['tr']}}}, max_workers=1)
+    assert results[0].get('title') == 'some movie'
+    assert str(results[0].get('subtitle_language')) == 'fr'
+    assert results[1].get('type') == 'episode'
+
+
+def test_guessit_parallel_advanced():
+    strings = ['some.movie.2010.mkv', 'Show.S01E00.FRENCH.ENGLISH.mkv']
+    results = guessit_parallel(strings, '--advanced', max_workers=1)
+    assert results[0]['title'].value == 'some movie'
+    assert results[0]['year'].advanced == {'value': 2010, 'raw': '2010', 'start': 11, 'end': 15}
+    assert results[1]['episode'].value == 0
+
+    for result, guess in zip(results, [guessit(string, '--advanced') for string in strings]):
+        assert type(result) is type(guess)  # pylint:disable=unidiomatic-typecheck
+        assert list(result) == list(guess)
+        for key, value in guess.items():
+            matches = value if isinstance(value, list) else [value]
+            parallel_matches = result[key] if isinstance(value, list) else [result[key]]
+            assert [type(match) for match in parallel_matches] == [type(match) for match in matches]
+            assert [(match.name, match.tags, match.advanced) for match in parallel_matches] == \
+                   [(match.name, match.tags, match.advanced) for match in matches]
+
+
+def test_guessit_parallel_exception():
+    results = guessit_parallel(['first.movie.mkv', 42, 'second.movie.mkv'], max_workers=1)
+    assert results[0].get('title') == 'first movie'
+    assert isinstance(results[1], GuessitException)
+    assert "An internal error has occurred in guessit" in str(results[1])
+    assert results[2].get('title') == 'second movie'
+
+
+def test_executor_recycles_workers(mocker: MockerFixture):
+    shutdown_spy = mocker.spy(ProcessPoolExecutor, 'shutdown')
+    strings = [f'Show.S01E{episode:02d}.mkv' for episode in range(1, 21)]
+    with GuessItExecutor(max_workers=2, chunk_size=3, max_tasks_per_child=1) as executor:
+        results = list(executor.map(iter(strings)))
+    assert [result.get('episode') for result in results] == list(range(1, 21))
+    assert shutdown_spy.call_count > 1
+    # Old workers are drained before new ones are started.
+    assert all(call.kwargs.get('wait', True) for call in shutdown_spy.call_args_list)
+
+
+def test_executor_invalid_parameters():
+    with pytest.raises(ValueError):
+        GuessItExecutor(chunk_size=0)
+    with pytest.raises(ValueError):
+        GuessItExecutor(max_tasks_per_child=0)
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='fork is not supported')
+def test_executor_forked_workers_inherit_rules(monkeypatch):
+    parent_pid = os.getpid()
+    rebulk_builder = api.rebulk_builder
+
+    def parent_only_rebulk_builder(config):
+        assert os.getpid() == parent_pid
+        return rebulk_builder(config)
+
+    monkeypatch.setattr(api, 'rebulk_builder', parent_only_rebulk_builder)
+
+    results = guessit_parallel(['Show.S01E01.mkv'], max_workers=2, mp_context=multiprocessing.get_context('fork'))
+
+    assert results[0].get('episode') == 1
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# pylint: disable=pointless-statement, missing-docstring, invalid-name, redefined-outer-name
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ..api import GuessItApi
+from ..server import create_server, GuessItClient, GuessItClientError
+
+
+def _start(address, **kwargs):
+    server = create_server(address, **kwargs)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, thread
+
+
+@pytest.fixture(scope='module')
+def client():
+    server, thread = _start('127.0.0.1:0', max_delay=0.01)
+    yield GuessItClient(f'127.0.0.1:{server.server_address[1]}', timeout=30)
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_guess(client):
+    result = client.guessit('Show.S01E02.FRENCH.mkv')
+    assert result['title'] == 'Show'
+    assert result['episode'] == 2
+    assert result['language'] == 'French'
+
+
+def test_guess_options(client):
+    assert client.guessit('Show.2010.mkv', '-t episode')['type'] == 'episode'
+    assert client.guessit('Show.2010.mkv', {'type': 'episode'})['type'] == 'episode'
+    assert client.guessit('Show.2010.mkv')['type'] == 'movie'
+
+
+def test_guess_many(client):
+    results = client.guessit_many([f'Show.S01E{episode:02d}.mkv' for episode in range(1, 6)])
+    assert [result['episode'] for result in results] == list(range(1, 6))
+
+
+def test_concurrent_requests(client):
+    strings = [f'Show.S01E{episode:02d}.mkv' for episode in range(1, 33)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(client.guessit, strings))
+    assert [result['episode'] for result in results] == list(range(1, 33))
+
+
+def test_errors(client):
+    with pytest.raises(GuessItClientError) as excinfo:
+        client._request('GET', '/unknown')  # pylint:disable=protected-access
+    assert excinfo.value.status == 404
+
+    with pytest.raises(GuessItClientError) as excinfo:
+        client._request('POST', '/guess_many', {'strings': 'Show.S01E01.mkv'})  # pylint:disable=protected-access
+    assert excinfo.value.status == 400
+
+
+def test_refused_options(client):
+    for options in ({'config': ['/etc/passwd']}, {'no_user_config': True}, {'advanced_config': {}},
+                    '-c /etc/passwd', '--unknown-option'):
+        with pytest.raises(GuessItClientError) as excinfo:
+            client.guessit('Show.2010.mkv', options)
+        assert excinfo.value.status == 400
+
+    with pytest.raises(GuessItClientError) as excinfo:
+        client.guessit_many(['Show.2010.mkv'], {'type': 'episode', 'advanced_config': {}})
+    assert excinfo.value.status == 400
+    assert 'advanced_config' in excinfo.value.message
+
+    guess = client.guessit('Show.2010.mkv', {'excludes': ['year'], 'output_input_string': True})
+    assert 'year' not in guess
+    assert guess['input_string'] == 'Show.2010.mkv'
+
+
+def test_sqlite_cache(tmp_path):
+    cached_api = GuessItApi(cache=tmp_path / 'cache.sqlite')
+    server, thread = _start('127.0.0.1:0', api=cached_api, max_delay=0.01)
+    try:
+        cached_client = GuessItClient(f'127.0.0.1:{server.server_address[1]}', timeout=30)
+        assert cached_client.guessit('Show.2010.mkv')['title'] == 'Show'
+        assert cached_client.guessit('Show.2010.mkv')['title'] == 'Show'
+        assert cached_api.cache_stats()['hits'] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+        cached_api.close()
+
+
+@pytest.mark.skipif(not hasattr(__import__('socket'), 'AF_UNIX'), reason='Unix sockets are not supported')
+def test_unix_socket(tmp_path):
+    address = 'unix:' + str(tmp_path / 'guessit.sock')
+    server, thread = _start(address, options={'type': 'episode'})
+    try:
+        assert GuessItClient(address, timeout=30).guessit('Show.2010.mkv')['type'] == 'episode'
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+    assert not (tmp_path / 'guessit.sock').exists()